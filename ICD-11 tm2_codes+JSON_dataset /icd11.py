@@ -1,29 +1,130 @@
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches.file_cache import FileCache
+except ImportError:
+    CacheControlAdapter = None
+try:
+    import httpx
+    import h2  # HTTP/2 support for httpx
+except ImportError:
+    httpx = None
 import json
 import os
+import re
+import shutil
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from threading import Lock
 import threading
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
 import unicodedata
+import zlib
+
+# Fast JSON (orjson) with stdlib fallback; both work on bytes
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj, indent: bool = True) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj, indent: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+# Retry policy shared by the pooled session and the HTTP/2 crawler
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Language detection patterns, compiled once
+# Sanskrit patterns (most comprehensive)
+_SANSKRIT_RE = re.compile('|'.join([
+    r'[ḥṃṅñṭḍṇśṣṛ]',  # Sanskrit diacritics
+    r'(aṃ|aḥ|tam|ṁ|yaṃ|dhiḥ)$',  # Sanskrit endings
+    r'^(pra|vi|sam|upa|ni|ā)',  # Sanskrit prefixes
+    r'(vaṃ|gaṃ|dhātu|vāta|pitta|kapha|agni)',  # Sanskrit medical terms
+]), re.IGNORECASE | re.UNICODE)
+
+# Arabic/Persian patterns (Unani)
+_ARABIC_RE = re.compile('|'.join([
+    r'(al-|el-|dubayla)',  # Arabic articles/terms
+    r'(kabid|jigar)',  # Unani terms
+]), re.IGNORECASE)
+
+# Tamil patterns (Siddha)
+_TAMIL_RE = re.compile(r'(katti|vali|roga)', re.IGNORECASE)  # Tamil medical terms
+
+def _nfc(text: str) -> str:
+    """NFC-normalize text, skipping the work when the quick check says it already is"""
+    if unicodedata.is_normalized('NFC', text):
+        return text
+    return unicodedata.normalize('NFC', text)
+
+def _encode_entity_shard(shard: Dict, path: str) -> str:
+    """Encode a shard of entities as indented object members nested one level deep (runs in a worker process)"""
+    body = _dumps(shard).replace(b'\n', b'\n  ')
+    with open(path, 'wb') as f:
+        f.write(body[1:-len(b'\n  }')])  # strip the shard's own braces
+    return path
 
 class FastTMExtractor:
     """
     Fast, optimized TM data extractor with progressive saving and detailed preservation
     """
     
-    def __init__(self, client_id: str, client_secret: str, base_dir: str = "tm_complete_dataset"):
+    def __init__(self, client_id: str, client_secret: str, base_dir: str = "tm_complete_dataset",
+                 save_entity_files: bool = False, max_qps: float = 20.0, burst: int = 32,
+                 use_http2: bool = False):
         self.client_id = ""
         self.client_secret = ""
         self.token_endpoint = 'https://icdaccessmanagement.who.int/connect/token'
         self.base_uri = 'https://id.who.int/icd'
         self.access_token = None
         self.base_dir = base_dir
+        self.save_entity_files = save_entity_files
+        self.use_http2 = use_http2  # opt-in httpx crawler; it does not use the on-disk HTTP cache
+        
+        # Pooled HTTP session (keep-alive + retries)
+        self.session = requests.Session()
+        pool_options = dict(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF, status_forcelist=list(RETRY_STATUSES))
+        )
+        adapter = None
+        if CacheControlAdapter is not None:
+            # On-disk HTTP cache: re-runs revalidate with ETag/Last-Modified and reuse bodies on 304.
+            # The caching adapter is an HTTPAdapter, so it keeps the same pool sizing and retries
+            try:
+                adapter = CacheControlAdapter(cache=FileCache(os.path.join(base_dir, '.http_cache')), **pool_options)
+            except ImportError:
+                pass  # FileCache imports filelock lazily; run uncached without it
+        if adapter is None:
+            adapter = HTTPAdapter(**pool_options)
+        # Child URIs come back from the API as http://, so both schemes share the adapter
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-        # Thread safety
-        self.lock = Lock()
+        # Thread safety: one lock per shared structure so workers rarely contend
+        # (code_index, sanskrit_terms and statistics are built after the crawl, see build_indexes)
+        self._flat_lock = Lock()  # processed_entities + flat_entities
+        self._log_lock = Lock()  # entities.jsonl + entity shard handles
+        
+        # Token-bucket rate limiting for API requests
+        self.max_qps = max_qps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._rate_lock = Lock()
         self.progress_lock = Lock()
         
         # Create directories
@@ -31,14 +132,22 @@ class FastTMExtractor:
         os.makedirs(os.path.join(base_dir, 'entities'), exist_ok=True)
         os.makedirs(os.path.join(base_dir, 'chunks'), exist_ok=True)
         
+        # Append-only entity log, one JSON object per line (opened with the first recorded entity)
+        self.entities_log_file = os.path.join(base_dir, 'entities.jsonl')
+        self._entities_fp = None
+        self._shard_fps = {}  # optional per-entity output, entities/shard_<xx>.jsonl
+        
         # Progress tracking
         self.progress_file = os.path.join(base_dir, 'extraction_progress.json')
         self.progress = self.load_progress()
         
+        # One timestamp for the whole run, shared by every extracted entity
+        self._run_start_iso = datetime.now().isoformat()
+        
         # Complete dataset storage
         self.complete_dataset = {
             'metadata': {
-                'extraction_timestamp': datetime.now().isoformat(),
+                'extraction_timestamp': self._run_start_iso,
                 'source': 'ICD-11 2025-01 Release - TM Module',
                 'extractor_version': '2.0',
                 'total_entities': 0,
@@ -64,8 +173,8 @@ class FastTMExtractor:
         """Load existing progress"""
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.progress_file, 'rb') as f:
+                    return _loads(f.read())
             except Exception:
                 pass
         return {
@@ -82,8 +191,8 @@ class FastTMExtractor:
             self.progress['last_update'] = datetime.now().isoformat()
             self.progress['total_found'] = len(self.processed_entities)
             try:
-                with open(self.progress_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.progress, f, indent=2, ensure_ascii=False)
+                with open(self.progress_file, 'wb') as f:
+                    f.write(_dumps(self.progress, indent=False))
             except Exception as e:
                 print(f"⚠️ Progress save failed: {e}")
     
@@ -97,10 +206,11 @@ class FastTMExtractor:
         }
         
         try:
-            response = requests.post(self.token_endpoint, data=payload, verify=True, timeout=30)
+            response = self.session.post(self.token_endpoint, data=payload, verify=True, timeout=30)
             response.raise_for_status()
             token_data = response.json()
             self.access_token = token_data['access_token']
+            self.session.headers.update(self.get_headers())
             print("✅ Authentication successful!")
             return True
         except Exception as e:
@@ -116,47 +226,49 @@ class FastTMExtractor:
             'API-Version': 'v2'
         }
     
+    def _take_rate_token(self) -> float:
+        """Take a token from the bucket and return how long the caller must wait for it"""
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.max_qps)
+            self._last_refill = now
+            self._tokens -= 1
+            return -self._tokens / self.max_qps if self._tokens < 0 else 0
+    
+    def wait_for_rate_limit(self):
+        """Take a token from the bucket, sleeping only when the burst allowance is used up"""
+        delay = self._take_rate_token()
+        if delay:
+            time.sleep(delay)
+    
+    async def wait_for_rate_limit_async(self):
+        """Async variant of wait_for_rate_limit for the HTTP/2 crawler"""
+        delay = self._take_rate_token()
+        if delay:
+            await asyncio.sleep(delay)
+    
     def detect_language(self, text: str) -> str:
         """Detect language of traditional medicine terms"""
         if not text:
             return 'unknown'
         
-        text_lower = text.lower()
-        
-        # Sanskrit patterns (most comprehensive)
-        sanskrit_indicators = [
-            r'[ḥṃṅñṭḍṇśṣṛ]',  # Sanskrit diacritics
-            r'(aṃ|aḥ|tam|ṁ|yaṃ|dhiḥ)$',  # Sanskrit endings
-            r'^(pra|vi|sam|upa|ni|ā)',  # Sanskrit prefixes
-            r'(vaṃ|gaṃ|dhātu|vāta|pitta|kapha|agni)',  # Sanskrit medical terms
-        ]
-        
-        # Arabic/Persian patterns (Unani)
-        arabic_indicators = [
-            r'(al-|el-|dubayla)',  # Arabic articles/terms
-            r'(kabid|jigar)',  # Unani terms
-        ]
-        
-        # Tamil patterns (Siddha)
-        tamil_indicators = [
-            r'(katti|vali|roga)',  # Tamil medical terms
-        ]
-        
-        import re
-        if any(re.search(pattern, text, re.IGNORECASE | re.UNICODE) for pattern in sanskrit_indicators):
+        if _SANSKRIT_RE.search(text):
             return 'sanskrit'
-        elif any(re.search(pattern, text, re.IGNORECASE) for pattern in arabic_indicators):
+        elif _ARABIC_RE.search(text):
             return 'arabic_persian'
-        elif any(re.search(pattern, text, re.IGNORECASE) for pattern in tamil_indicators):
+        elif _TAMIL_RE.search(text):
             return 'tamil'
         else:
             return 'english_or_unknown'
     
     def extract_text_value(self, obj) -> str:
-        """Extract text from multilingual object, preserving Unicode"""
-        if isinstance(obj, dict):
-            return obj.get('@value', '') or obj.get('en', '') or str(obj)
-        return str(obj) if obj else ''
+        """Extract text from multilingual object, preserving Unicode (NFC-normalized)"""
+        if obj.__class__ is dict:
+            value = obj.get('@value') or obj.get('en')
+            return _nfc(value) if value else ''
+        if obj.__class__ is str:
+            return _nfc(obj)
+        return _nfc(str(obj)) if obj else ''
     
     def extract_text_list(self, obj_list: List) -> List[str]:
         """Extract text list preserving Unicode"""
@@ -169,143 +281,305 @@ class FastTMExtractor:
     
     def extract_index_terms_detailed(self, index_terms: List) -> List[Dict]:
         """Extract index terms with language detection and detailed analysis"""
-        terms = []
+        if not index_terms:
+            return []
+        
+        # Collect labelled terms first, then detect each label's language
+        labelled = []
         for term in index_terms:
             if isinstance(term, dict):
                 text = self.extract_text_value(term.get('label', {}))
                 if text and text.strip():
-                    language = self.detect_language(text)
-                    
-                    term_data = {
-                        'text': text.strip(),
-                        'language': language,
-                        'foundationReference': term.get('foundationReference', ''),
-                        'termId': term.get('@id', ''),
-                        'raw': term
-                    }
-                    terms.append(term_data)
-                    
-                    # Update language statistics
-                    with self.lock:
-                        if language not in self.complete_dataset['statistics']['languages_detected']:
-                            self.complete_dataset['statistics']['languages_detected'][language] = 0
-                        self.complete_dataset['statistics']['languages_detected'][language] += 1
-        return terms
+                    labelled.append((term, text))
+        
+        languages = [self.detect_language(text) for _, text in labelled]
+        
+        return [
+            {
+                'text': text.strip(),
+                'language': language,
+                'foundationReference': term.get('foundationReference', ''),
+                'termId': term.get('@id', ''),
+                'raw': term
+            }
+            for (term, text), language in zip(labelled, languages)
+        ]
     
-    def process_single_entity(self, entity_uri: str, depth: int = 0, parent_path: List[str] = None) -> Optional[Dict]:
+    def process_single_entity(self, entity_uri: str, depth: int = 0, parent_path: Tuple[str, ...] = ()) -> Optional[Dict]:
         """Process a single entity with full detail extraction"""
-        if parent_path is None:
-            parent_path = []
+        entity_id = entity_uri.split('/')[-1]
+        if entity_id in self.processed_entities:
+            return None
+        
+        try:
+            # Parse the raw body bytes directly and hand the connection back to the pool
+            self.wait_for_rate_limit()
+            response = self.session.get(entity_uri, verify=True, timeout=30, stream=True)
+            try:
+                response.raise_for_status()
+                entity_data = _loads(response.content)
+            finally:
+                response.close()
+            
+            return self.record_entity(entity_uri, entity_data, depth, parent_path)
             
+        except Exception as e:
+            print(f"❌ Failed to process {entity_uri}: {e}")
+            return None
+    
+    async def process_single_entity_async(self, client, entity_uri: str, depth: int = 0,
+                                          parent_path: Tuple[str, ...] = ()) -> Optional[Dict]:
+        """Async variant of process_single_entity using a shared httpx client"""
         entity_id = entity_uri.split('/')[-1]
         if entity_id in self.processed_entities:
             return None
         
         try:
-            response = requests.get(entity_uri, headers=self.get_headers(), verify=True, timeout=30)
+            # Same retry policy as the pooled session: transport errors and 429/5xx with exponential backoff
+            for attempt in range(RETRY_TOTAL + 1):
+                await self.wait_for_rate_limit_async()
+                try:
+                    response = await client.get(entity_uri)
+                except httpx.TransportError:
+                    if attempt == RETRY_TOTAL:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                        break
+                await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
             response.raise_for_status()
-            entity_data = response.json()
-            
-            # Extract complete details
-            entity_details = {
-                'uri': entity_uri,
-                'id': entity_id,
-                'title': self.extract_text_value(entity_data.get('title', {})),
-                'code': self.extract_text_value(entity_data.get('code', {})),
-                'definition': self.extract_text_value(entity_data.get('definition', {})),
-                'longDefinition': self.extract_text_value(entity_data.get('longDefinition', {})),
-                'fullySpecifiedName': self.extract_text_value(entity_data.get('fullySpecifiedName', {})),
-                'synonym': self.extract_text_list(entity_data.get('synonym', [])),
-                'narrowerTerm': self.extract_text_list(entity_data.get('narrowerTerm', [])),
-                'indexTerm': self.extract_index_terms_detailed(entity_data.get('indexTerm', [])),
-                'inclusion': self.extract_text_list(entity_data.get('inclusion', [])),
-                'exclusion': self.extract_text_list(entity_data.get('exclusion', [])),
-                'note': self.extract_text_list(entity_data.get('note', [])),
-                'codingNote': self.extract_text_list(entity_data.get('codingNote', [])),
-                'children': entity_data.get('child', []),
-                'parent': entity_data.get('parent', []),
-                'browserUrl': entity_data.get('browserUrl', ''),
-                'foundationChildElsewhere': entity_data.get('foundationChildElsewhere', []),
-                'isLeaf': len(entity_data.get('child', [])) == 0,
-                'childCount': len(entity_data.get('child', [])),
-                'depth': depth,
-                'parentPath': parent_path.copy(),
-                'extractionTimestamp': datetime.now().isoformat(),
-                'raw_data': entity_data
-            }
+            entity_data = _loads(response.content)
             
-            # Mark as processed
-            with self.lock:
-                self.processed_entities.add(entity_id)
-                self.complete_dataset['flat_entities'][entity_id] = entity_details
-                
-                # Update code index
-                if entity_details['code']:
-                    self.complete_dataset['code_index'][entity_details['code']] = entity_id
-                    
-                    # Count disorders vs patterns
-                    if 'disorder' in entity_details['title'].lower():
-                        self.complete_dataset['statistics']['total_disorders'] += 1
-                    elif 'pattern' in entity_details['title'].lower():
-                        self.complete_dataset['statistics']['total_patterns'] += 1
-                
-                # Index Sanskrit terms separately
-                for index_term in entity_details['indexTerm']:
-                    if index_term['language'] == 'sanskrit':
-                        if entity_details['code'] not in self.complete_dataset['sanskrit_terms']:
-                            self.complete_dataset['sanskrit_terms'][entity_details['code']] = []
-                        self.complete_dataset['sanskrit_terms'][entity_details['code']].append({
-                            'term': index_term['text'],
-                            'entity_id': entity_id
-                        })
-                
-                self.complete_dataset['statistics']['total_index_terms'] += len(entity_details['indexTerm'])
-                self.complete_dataset['metadata']['total_entities'] = len(self.processed_entities)
+            return self.record_entity(entity_uri, entity_data, depth, parent_path)
             
-            # Save individual entity
-            entity_file = os.path.join(self.base_dir, 'entities', f'{entity_id}.json')
+        except Exception as e:
+            print(f"❌ Failed to process {entity_uri}: {e}")
+            return None
+    
+    def record_entity(self, entity_uri: str, entity_data: Dict, depth: int, parent_path: Tuple[str, ...]) -> Dict:
+        """Extract full details from a parsed entity response, record and log it"""
+        entity_id = entity_uri.split('/')[-1]
+        
+        # Extract complete details
+        children = entity_data.get('child', [])
+        text_value = self.extract_text_value
+        text_list = self.extract_text_list
+        entity_details = {
+            'uri': entity_uri,
+            'id': entity_id,
+            'title': text_value(entity_data.get('title', {})),
+            'code': text_value(entity_data.get('code', {})),
+            'definition': text_value(entity_data.get('definition', {})),
+            'longDefinition': text_value(entity_data.get('longDefinition', {})),
+            'fullySpecifiedName': text_value(entity_data.get('fullySpecifiedName', {})),
+            'synonym': text_list(entity_data.get('synonym', [])),
+            'narrowerTerm': text_list(entity_data.get('narrowerTerm', [])),
+            'indexTerm': self.extract_index_terms_detailed(entity_data.get('indexTerm', [])),
+            'inclusion': text_list(entity_data.get('inclusion', [])),
+            'exclusion': text_list(entity_data.get('exclusion', [])),
+            'note': text_list(entity_data.get('note', [])),
+            'codingNote': text_list(entity_data.get('codingNote', [])),
+            'children': children,
+            'parent': entity_data.get('parent', []),
+            'browserUrl': entity_data.get('browserUrl', ''),
+            'foundationChildElsewhere': entity_data.get('foundationChildElsewhere', []),
+            'isLeaf': not children,
+            'childCount': len(children),
+            'depth': depth,
+            'parentPath': list(parent_path),
+            'extractionTimestamp': self._run_start_iso,
+            'raw_data': entity_data
+        }
+        
+        # Raw API response goes to disk only, never into the in-memory dataset
+        flat_details = {k: v for k, v in entity_details.items() if k != 'raw_data'}
+        
+        # Mark as processed
+        with self._flat_lock:
+            self.processed_entities.add(entity_id)
+            self.complete_dataset['flat_entities'][entity_id] = flat_details
+        
+        # Append to entity log
+        line = _dumps(entity_details, indent=False) + b'\n'
+        with self._log_lock:
+            if self._entities_fp is None:
+                self._entities_fp = open(self.entities_log_file, 'wb')
+            self._entities_fp.write(line)
+        
+        # Save individual entity (optional, batched into 256 shard files)
+        if self.save_entity_files:
+            # crc32 rather than hash(): str hashing is salted per process, shards must be stable across runs
+            shard = int(entity_id) & 0xFF if entity_id.isdigit() else zlib.crc32(entity_id.encode()) & 0xFF
             try:
-                with open(entity_file, 'w', encoding='utf-8') as f:
-                    json.dump(entity_details, f, indent=2, ensure_ascii=False)
+                with self._log_lock:
+                    fp = self._shard_fps.get(shard)
+                    if fp is None:
+                        shard_file = os.path.join(self.base_dir, 'entities', f'shard_{shard:02x}.jsonl')
+                        fp = self._shard_fps[shard] = open(shard_file, 'wb')
+                    fp.write(line)
             except Exception as e:
                 print(f"⚠️ Failed to save entity {entity_id}: {e}")
+        
+        # Progress logging
+        code = entity_details['code']
+        title = entity_details['title'][:60] + "..." if len(entity_details['title']) > 60 else entity_details['title']
+        indent = "  " * depth
+        print(f"{indent}✅ {code} {title} ({len(entity_details['children'])} children, {len(entity_details['indexTerm'])} terms)")
+        
+        return flat_details
+    
+    def extract_all_tm_entities_recursive(self, start_uri: str, max_depth: int = 15, max_workers: int = 32) -> bool:
+        """Extract all TM entities breadth-first starting from TM chapter, fetching in parallel"""
+        print(f"🔄 Starting parallel extraction from: {start_uri}")
+        
+        scheduled: Set[str] = set()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
             
-            # Progress logging
-            code = entity_details['code']
-            title = entity_details['title'][:60] + "..." if len(entity_details['title']) > 60 else entity_details['title']
-            indent = "  " * depth
-            print(f"{indent}✅ {code} {title} ({len(entity_details['children'])} children, {len(entity_details['indexTerm'])} terms)")
+            def submit(uri: str, depth: int, parent_path: Tuple[str, ...]):
+                entity_id = uri.split('/')[-1]
+                with self._flat_lock:
+                    if entity_id in scheduled or entity_id in self.processed_entities:
+                        return
+                    scheduled.add(entity_id)
+                future = executor.submit(self.process_single_entity, uri, depth, parent_path)
+                pending[future] = (depth, parent_path)
             
-            return entity_details
+            submit(start_uri, 0, ())
             
-        except Exception as e:
-            print(f"❌ Failed to process {entity_uri}: {e}")
-            return None
+            # Each finished entity queues its children for the next level
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth, parent_path = pending.pop(future)
+                    entity = future.result()
+                    if not entity or depth >= max_depth:
+                        continue
+                    
+                    current_path = parent_path + (entity['id'],)
+                    for child_uri in entity['children']:
+                        submit(child_uri, depth + 1, current_path)
+        
+        return True
     
-    def extract_all_tm_entities_recursive(self, start_uri: str, max_depth: int = 15) -> bool:
-        """Recursively extract all TM entities starting from TM chapter"""
-        print(f"🔄 Starting recursive extraction from: {start_uri}")
+    async def extract_all_tm_entities_async(self, start_uri: str, max_depth: int = 15,
+                                            max_concurrency: int = 64) -> bool:
+        """Extract all TM entities breadth-first over multiplexed HTTP/2 connections"""
+        print(f"🔄 Starting HTTP/2 extraction from: {start_uri}")
         
-        def recursive_worker(uri: str, depth: int = 0, parent_path: List[str] = None):
-            if depth > max_depth:
-                return
-            
-            entity = self.process_single_entity(uri, depth, parent_path)
-            if not entity:
-                return
-            
-            entity_id = entity['id']
-            current_path = (parent_path or []) + [entity_id]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        scheduled: Set[str] = {start_uri.split('/')[-1]}
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        
+        async with httpx.AsyncClient(http2=True, limits=limits, headers=self.get_headers(), timeout=30) as client:
+            async def crawl(uri: str, depth: int, parent_path: Tuple[str, ...]):
+                async with semaphore:
+                    entity = await self.process_single_entity_async(client, uri, depth, parent_path)
+                if not entity or depth >= max_depth:
+                    return
+                
+                current_path = parent_path + (entity['id'],)
+                children = []
+                for child_uri in entity['children']:
+                    child_id = child_uri.split('/')[-1]
+                    if child_id not in scheduled:
+                        scheduled.add(child_id)
+                        children.append(crawl(child_uri, depth + 1, current_path))
+                await asyncio.gather(*children)
             
-            # Process children
-            for child_uri in entity['children']:
-                recursive_worker(child_uri, depth + 1, current_path)
-                time.sleep(0.05)  # Rate limiting
+            await crawl(start_uri, 0, ())
         
-        # Start recursive extraction
-        recursive_worker(start_uri)
         return True
     
+    def build_indexes(self):
+        """Build code index, Sanskrit term index and statistics in one pass over the extracted entities"""
+        flat_entities = self.complete_dataset['flat_entities']
+        code_index = {}
+        sanskrit_terms = {}
+        languages_detected = Counter()
+        total_disorders = 0
+        total_patterns = 0
+        total_index_terms = 0
+        
+        for entity_id, entity in flat_entities.items():
+            code = entity['code']
+            if code:
+                code_index[code] = entity_id
+                
+                # Count disorders vs patterns
+                title = entity['title'].lower()
+                if 'disorder' in title:
+                    total_disorders += 1
+                elif 'pattern' in title:
+                    total_patterns += 1
+            
+            index_terms = entity['indexTerm']
+            total_index_terms += len(index_terms)
+            for index_term in index_terms:
+                languages_detected[index_term['language']] += 1
+                
+                # Index Sanskrit terms separately, one bucket per code; like code_index, entities
+                # without a code are left out rather than collapsed into a single '' bucket
+                if code and index_term['language'] == 'sanskrit':
+                    bucket = sanskrit_terms.setdefault(code, {'entity_id': entity_id, 'terms': []})
+                    bucket['terms'].append(index_term['text'])
+        
+        self.complete_dataset['code_index'] = code_index
+        self.complete_dataset['sanskrit_terms'] = sanskrit_terms
+        self.complete_dataset['statistics'].update({
+            'total_disorders': total_disorders,
+            'total_patterns': total_patterns,
+            'total_index_terms': total_index_terms,
+            'languages_detected': dict(languages_detected)
+        })
+        self.complete_dataset['metadata']['total_entities'] = len(flat_entities)
+    
+    def close(self):
+        """Flush and close the append-only entity log and any entity shard files"""
+        with self._log_lock:
+            if self._entities_fp is not None:
+                self._entities_fp.close()
+                self._entities_fp = None
+            for fp in self._shard_fps.values():
+                fp.close()
+            self._shard_fps.clear()
+    
+    def encode_entity_shards(self) -> List[str]:
+        """Serialize flat_entities into chunks/flat_part_<i>.json using one process per CPU"""
+        entities = list(self.complete_dataset['flat_entities'].items())
+        if not entities:
+            return []
+        
+        workers = os.cpu_count() or 1
+        shard_size = -(-len(entities) // workers)
+        shards = [dict(entities[i:i + shard_size]) for i in range(0, len(entities), shard_size)]
+        paths = [os.path.join(self.base_dir, 'chunks', f'flat_part_{i}.json') for i in range(len(shards))]
+        
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            return list(executor.map(_encode_entity_shard, shards, paths))
+    
+    def _write_dataset_file(self, filename: str, sections: Dict, entities_key: str, shard_files: List[str]):
+        """Write an indented top-level JSON object, streaming the entity section from pre-encoded shards"""
+        with open(filename, 'wb') as f:
+            f.write(b'{')
+            for i, (key, value) in enumerate(sections.items()):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(_dumps(key) + b': ')
+                if key != entities_key:
+                    f.write(_dumps(value).replace(b'\n', b'\n  '))
+                elif not shard_files:
+                    f.write(b'{}')
+                else:
+                    f.write(b'{')
+                    for j, path in enumerate(shard_files):
+                        if j:
+                            f.write(b',')
+                        with open(path, 'rb') as part:
+                            shutil.copyfileobj(part, f)
+                    f.write(b'\n  }')
+            f.write(b'\n}')
+    
     def save_complete_dataset(self, filename: str = None):
         """Save the complete dataset with all extracted data"""
         if filename is None:
@@ -316,8 +590,10 @@ class FastTMExtractor:
         self.complete_dataset['metadata']['completion_timestamp'] = datetime.now().isoformat()
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.complete_dataset, f, indent=2, ensure_ascii=False)
+            # Encode entity shards in parallel, once, for both output files
+            shard_files = self.encode_entity_shards()
+            
+            self._write_dataset_file(filename, self.complete_dataset, 'flat_entities', shard_files)
             print(f"💾 Complete dataset saved: {filename}")
             
             # Also save flattened version
@@ -330,10 +606,12 @@ class FastTMExtractor:
                 'statistics': self.complete_dataset['statistics']
             }
             
-            with open(flat_filename, 'w', encoding='utf-8') as f:
-                json.dump(flat_data, f, indent=2, ensure_ascii=False)
+            self._write_dataset_file(flat_filename, flat_data, 'entities', shard_files)
             print(f"💾 Flattened dataset saved: {flat_filename}")
             
+            for path in shard_files:
+                os.remove(path)
+            
             # Save progress every 50 entities
             if len(self.processed_entities) % 50 == 0:
                 self.save_progress()
@@ -358,11 +636,18 @@ class FastTMExtractor:
         print(f"📋 Starting extraction from TM Chapter: {tm_chapter_uri}")
         self.progress['extraction_stage'] = 'extracting_entities'
         
-        # Extract all entities recursively
-        success = self.extract_all_tm_entities_recursive(tm_chapter_uri)
+        # Extract all entities (thread pool over the cached session; HTTP/2 fan-out when opted in)
+        try:
+            if self.use_http2 and httpx is not None:
+                success = asyncio.run(self.extract_all_tm_entities_async(tm_chapter_uri))
+            else:
+                success = self.extract_all_tm_entities_recursive(tm_chapter_uri)
+        finally:
+            self.close()
         
         if success:
             self.progress['extraction_stage'] = 'saving_dataset'
+            self.build_indexes()
             self.save_complete_dataset()
             
             # Final statistics
@@ -378,8 +663,8 @@ class FastTMExtractor:
             # Show Sanskrit terms sample
             if self.complete_dataset['sanskrit_terms']:
                 print(f"\n📜 Sanskrit Terms Sample:")
-                for code, terms in list(self.complete_dataset['sanskrit_terms'].items())[:5]:
-                    print(f"   {code}: {', '.join([t['term'] for t in terms])}")
+                for code, bucket in list(self.complete_dataset['sanskrit_terms'].items())[:5]:
+                    print(f"   {code}: {', '.join(bucket['terms'])}")
             
             self.progress['extraction_stage'] = 'completed'
             self.save_progress()
@@ -411,7 +696,7 @@ def main():
         print(f"\n📁 Generated Files:")
         print(f"   • tm_complete_dataset.json - Complete hierarchical dataset")
         print(f"   • tm_complete_dataset_flat.json - Flattened entities")
-        print(f"   • entities/ - Individual entity files")
+        print(f"   • entities.jsonl - Entity log (one entity per line)")
         print(f"   • extraction_progress.json - Progress tracking")
         print(f"\n🔍 Ready for NAMASTE code mapping!")
     else:
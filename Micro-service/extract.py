@@ -3,7 +3,7 @@ import sys
 import subprocess
 
 # Check and install required packages
-required_packages = ['selenium', 'pandas', 'openpyxl']
+required_packages = ['selenium', 'pandas', 'openpyxl', 'requests', 'lxml']
 
 for package in required_packages:
     try:
@@ -19,9 +19,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 import pandas as pd
+import requests
+import lxml.html
 import time
 import json
 import os
+import re
+
+# JS data file that backs the SAT-COMBINED table on the portal
+SAT_COMBINED_JS_URL = "https://namaste.ayush.gov.in/admin/js/codes/ayu_sat_table_combined.js"
+TAG_RE = re.compile(r'<[^>]*>')
 
 def setup_chrome_driver():
     """Setup Chrome driver with proper options for macOS"""
@@ -44,9 +51,60 @@ def setup_chrome_driver():
         print("   brew install chromedriver")
         return None
 
+def clean_cell(value):
+    """Render a raw record value the way the table cell shows it"""
+    if value is None:
+        return ''
+    return TAG_RE.sub('', str(value)).strip()
+
+def fetch_sat_combined_records(session):
+    """Fetch SAT-Combined rows directly from the portal's JS data file (no browser)"""
+    response = session.get(SAT_COMBINED_JS_URL, timeout=60)
+    response.raise_for_status()
+    # Decode explicitly: without a charset header requests would fall back to ISO-8859-1
+    content = response.content.decode('utf-8')
+    
+    json_start = content.find('[{')
+    json_end = content.rfind('}]') + 2
+    if json_start < 0 or json_end <= json_start:
+        raise ValueError("Could not locate JSON data in SAT-Combined JS file")
+    
+    records = json.loads(content[json_start:json_end])
+    
+    extracted_data = []
+    for record in records:
+        term_data = {
+            'term_id': clean_cell(record.get('t_id')),
+            'parent_id': clean_cell(record.get('parent_id')),
+            'code': clean_cell(record.get('term_id')),
+            'word': clean_cell(record.get('wordtree')),
+            'short_definition': clean_cell(record.get('w_trans')),
+            'long_definition': clean_cell(record.get('w_def')),
+            'reference': clean_cell(record.get('refn'))
+        }
+        
+        if term_data['term_id'] and term_data['code']:
+            extracted_data.append(term_data)
+    
+    return extracted_data
+
 def extract_namaste_data():
     """Extract SAT-Combined data from NAMASTE portal"""
     
+    print("🚀 Fetching SAT-Combined data directly from NAMASTE portal...")
+    try:
+        with requests.Session() as session:
+            extracted_data = fetch_sat_combined_records(session)
+        print(f"✅ Extraction completed: {len(extracted_data)} terms found")
+        return extracted_data
+    except Exception as e:
+        print(f"⚠️ Direct fetch failed ({e}), falling back to browser extraction...")
+    
+    return extract_namaste_data_selenium()
+
+def extract_namaste_data_selenium():
+    """Extract SAT-Combined data from NAMASTE portal by rendering the table in Chrome"""
+    
     driver = setup_chrome_driver()
     if not driver:
         return []
@@ -108,23 +166,24 @@ def extract_namaste_data():
         except:
             print("⚠️ Could not set 'show all', proceeding with current view...")
         
-        # Extract table data
-        rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+        # Extract table data from a single page_source snapshot, parsed in-process
+        tree = lxml.html.fromstring(driver.page_source)
+        rows = tree.xpath('//tbody/tr')
         print(f"📊 Found {len(rows)} table rows")
         
         for i, row in enumerate(rows):
             try:
-                cells = row.find_elements(By.TAG_NAME, "td")
+                cells = [td.text_content().strip() for td in row.xpath('./td')]
                 
                 if len(cells) >= 7:
                     term_data = {
-                        'term_id': cells[0].text.strip(),
-                        'parent_id': cells[1].text.strip(),
-                        'code': cells[2].text.strip(),
-                        'word': cells[3].text.strip(),
-                        'short_definition': cells[4].text.strip(),
-                        'long_definition': cells[5].text.strip(),
-                        'reference': cells[6].text.strip() if len(cells) > 6 else ''
+                        'term_id': cells[0],
+                        'parent_id': cells[1],
+                        'code': cells[2],
+                        'word': cells[3],
+                        'short_definition': cells[4],
+                        'long_definition': cells[5],
+                        'reference': cells[6] if len(cells) > 6 else ''
                     }
                     
                     if term_data['term_id'] and term_data['code']:
@@ -5,15 +5,54 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 import pandas as pd
+import lxml.html
+import pyarrow as pa
+import pyarrow.parquet as pq
+import argparse
+import csv
 import time
-import json
+import orjson
 import os
+import re
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from extract_firefox_pagination import fetch_all_records, Deduplicator
 
-def setup_headless_driver():
+FIRST_PAGE = 1042
+LAST_PAGE = 1330
+ROWS_PER_PAGE = 10  # SAT-Combined table page size
+BROWSER_POOL_SIZE = 4
+
+# Resources the table scraper never needs
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.woff*", "*.ttf", "*.css",
+    "*google-analytics*", "*googletagmanager*"
+]
+TAG_RE = re.compile(r'<[^>]*>')
+
+# Pagination link locators (searched under the pager), tried in order; the first that works is remembered
+PAGINATION_CONTAINER = (By.CSS_SELECTOR, ".dataTables_paginate")
+PAGE_LINK_SELECTORS = [
+    (By.XPATH, ".//a[text()='{page}' and contains(@class, 'paginate')]"),
+    (By.XPATH, ".//a[@data-dt-idx='{page}']"),
+    (By.LINK_TEXT, "{page}")
+]
+_working_page_selector = None
+_pagination_containers = {}  # driver session id -> pager element
+
+# Fetch the table body markup in one WebDriver round-trip; cells are parsed locally with lxml
+TABLE_BODY_JS = "return [...document.querySelectorAll('tbody')].map(tbody => tbody.outerHTML).join('');"
+
+def setup_headless_driver(profile_dir=None):
     """Setup headless Chrome driver (no browser window)"""
     chrome_options = Options()
     
+    # Separate profile per driver so pooled browsers don't clash
+    if profile_dir:
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+    
     # HEADLESS MODE - No browser window
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
@@ -22,44 +61,142 @@ def setup_headless_driver():
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
     
+    # Skip images, stylesheets and fonts - only the table HTML matters
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.stylesheet": 2
+    })
+    
     print("🔧 Setting up headless Chrome driver...")
     
     try:
         driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         print("✅ Headless driver ready")
         return driver
     except Exception as e:
         print(f"❌ Driver setup failed: {e}")
         return None
 
+def open_sat_combined(driver):
+    """Load the portal and switch to the SAT-COMBINED table"""
+    try:
+        driver.get("https://namaste.ayush.gov.in/sat_Ayurveda")
+        
+        # Click SAT-COMBINED tab
+        WebDriverWait(driver, 20).until(
+            EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'SAT-COMBINED')]"))
+        )
+        
+        sat_combined_tab = driver.find_element(By.XPATH, "//a[contains(text(), 'SAT-COMBINED')]")
+        driver.execute_script("arguments[0].click();", sat_combined_tab)
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr"))
+        )
+        return True
+    except Exception as e:
+        print(f"❌ Could not open SAT-COMBINED table: {e}")
+        return False
+
+class BrowserPool:
+    """Pool of headless Chrome drivers, each already showing the SAT-COMBINED table"""
+    
+    def __init__(self, size):
+        self.drivers = []
+        self._available = queue.Queue()
+        
+        for i in range(size):
+            driver = setup_headless_driver(profile_dir=f'/tmp/chrome-{i}')
+            if not driver:
+                continue
+            if open_sat_combined(driver):
+                self.drivers.append(driver)
+                self._available.put(driver)
+            else:
+                driver.quit()
+    
+    def __len__(self):
+        return len(self.drivers)
+    
+    @contextmanager
+    def driver(self):
+        """Check out a driver for exclusive use, returning it to the pool afterwards"""
+        driver = self._available.get()
+        try:
+            yield driver
+        finally:
+            self._available.put(driver)
+    
+    def close(self):
+        for driver in self.drivers:
+            driver.quit()
+
+def first_table_row(driver):
+    """Current first table row, used to detect when the table re-renders"""
+    try:
+        return driver.find_element(By.CSS_SELECTOR, "tbody tr")
+    except:
+        return None
+
+def wait_for_table_update(driver, old_row, page_num=None, timeout=10):
+    """Wait until the old first row is gone and, if given, the active page shows page_num"""
+    try:
+        if old_row is not None:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(old_row))
+        if page_num is not None:
+            WebDriverWait(driver, timeout).until(
+                EC.text_to_be_present_in_element((By.CSS_SELECTOR, ".paginate_button.current"), str(page_num))
+            )
+    except:
+        pass
+
+def pagination_container(driver):
+    """Get the table pager element, looked up once per driver (falls back to the whole page)"""
+    container = _pagination_containers.get(driver.session_id)
+    if container is None:
+        try:
+            container = driver.find_element(*PAGINATION_CONTAINER)
+        except:
+            return driver
+        _pagination_containers[driver.session_id] = container
+    return container
+
 def navigate_to_specific_page(driver, page_num):
     """Navigate to specific page number"""
+    global _working_page_selector
     try:
-        # Method 1: Look for direct page link
-        page_selectors = [
-            f"//a[text()='{page_num}' and contains(@class, 'paginate')]",
-            f"//a[@data-dt-idx='{page_num}']",
-            f"//a[text()='{page_num}']"
-        ]
+        old_row = first_table_row(driver)
+        container = pagination_container(driver)
+        
+        # Method 1: Look for direct page link - known-good selector first, others probed briefly
+        page_selectors = sorted(PAGE_LINK_SELECTORS, key=lambda selector: selector != _working_page_selector)
         
         for selector in page_selectors:
+            by, template = selector
+            timeout = 5 if selector == _working_page_selector else 1
             try:
-                page_link = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
+                page_link = WebDriverWait(container, timeout).until(
+                    EC.element_to_be_clickable((by, template.format(page=page_num)))
                 )
                 driver.execute_script("arguments[0].click();", page_link)
-                time.sleep(2)
+                wait_for_table_update(driver, old_row, page_num)
+                _working_page_selector = selector
                 return True
             except:
                 continue
         
+        # The pager may have been re-rendered; look it up again next time
+        _pagination_containers.pop(driver.session_id, None)
+        
         # Method 2: Use pagination input if available
         try:
             page_input = driver.find_element(By.CSS_SELECTOR, "input[type='number']")
             page_input.clear()
             page_input.send_keys(str(page_num))
             page_input.send_keys("\n")
-            time.sleep(2)
+            wait_for_table_update(driver, old_row, page_num)
             return True
         except:
             pass
@@ -74,7 +211,8 @@ def navigate_to_specific_page(driver, page_num):
                     try:
                         next_btn = driver.find_element(By.XPATH, "//a[contains(text(), 'Next') or contains(@aria-label, 'Next')]")
                         driver.execute_script("arguments[0].click();", next_btn)
-                        time.sleep(1)
+                        wait_for_table_update(driver, old_row)
+                        old_row = first_table_row(driver)
                     except:
                         break
                 return True
@@ -85,7 +223,8 @@ def navigate_to_specific_page(driver, page_num):
                     try:
                         prev_btn = driver.find_element(By.XPATH, "//a[contains(text(), 'Previous') or contains(@aria-label, 'Previous')]")
                         driver.execute_script("arguments[0].click();", prev_btn)
-                        time.sleep(1)
+                        wait_for_table_update(driver, old_row)
+                        old_row = first_table_row(driver)
                     except:
                         break
                 return True
@@ -129,26 +268,25 @@ def extract_all_page_data(driver, page_num):
             EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr"))
         )
         
-        # Get all table rows
-        rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+        # Get all table rows as lists of cell texts
+        tree = lxml.html.fromstring(f"<table>{driver.execute_script(TABLE_BODY_JS)}</table>")
+        rows = [[td.text_content().strip() for td in tr.xpath('./td')] for tr in tree.xpath('.//tbody/tr')]
         
-        for row_index, row in enumerate(rows):
+        for row_index, cells in enumerate(rows):
             try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                
                 # Extract data from all columns
                 if len(cells) >= 7:
                     row_data = {
                         'page_number': page_num,
                         'row_index': row_index + 1,
-                        'sr_no': cells[0].text.strip(),
-                        'term_id': cells[1].text.strip(),
-                        'parent_id': cells[2].text.strip(),
-                        'code': cells[3].text.strip(),
-                        'word': cells[4].text.strip(),
-                        'short_definition': cells[5].text.strip(),
-                        'long_definition': cells[6].text.strip(),
-                        'reference': cells[7].text.strip() if len(cells) > 7 else '',
+                        'sr_no': cells[0],
+                        'term_id': cells[1],
+                        'parent_id': cells[2],
+                        'code': cells[3],
+                        'word': cells[4],
+                        'short_definition': cells[5],
+                        'long_definition': cells[6],
+                        'reference': cells[7] if len(cells) > 7 else '',
                         'extraction_timestamp': datetime.now().isoformat()
                     }
                     
@@ -165,21 +303,132 @@ def extract_all_page_data(driver, page_num):
     
     return page_data
 
-def save_incremental_data(all_data, csv_filename):
-    """Save data incrementally after each page"""
-    try:
-        df = pd.DataFrame(all_data)
-        df.to_csv(csv_filename, index=False, encoding='utf-8')
-        return True
-    except Exception as e:
-        print(f"Error saving data: {e}")
-        return False
+class IncrementalCSVWriter:
+    """Append rows to a CSV file as pages arrive, keeping the handle open for the whole run"""
+    
+    def __init__(self, csv_filename):
+        self.csv_filename = csv_filename
+        self._file = open(csv_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._writer = None
+    
+    def write_page(self, page_data):
+        """Append one page of rows; the header is written with the first page"""
+        if not page_data:
+            return True
+        try:
+            if self._writer is None:
+                self._writer = csv.DictWriter(self._file, fieldnames=list(page_data[0].keys()), lineterminator='\n')
+                self._writer.writeheader()
+            self._writer.writerows(page_data)
+            return True
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return False
+    
+    def close(self):
+        self._file.close()
 
-def extract_pages_1042_1330():
-    """Extract ALL data from pages 1042-1330 with incremental saves"""
+class IncrementalParquetWriter:
+    """Stream pages into one zstd-compressed Parquet file (row group per page)"""
     
-    driver = setup_headless_driver()
-    if not driver:
+    def __init__(self, parquet_filename):
+        self.parquet_filename = parquet_filename
+        self._writer = None
+    
+    def write_page(self, page_data):
+        if not page_data:
+            return
+        table = pa.Table.from_pylist(page_data)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.parquet_filename, table.schema, compression='zstd')
+        self._writer.write_table(table)
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+def record_to_row(record, position):
+    """Convert a raw SAT-Combined record to the row layout of the rendered table"""
+    def cell(key):
+        value = record.get(key)
+        return '' if value is None else TAG_RE.sub('', str(value)).strip()
+    
+    return {
+        'page_number': position // ROWS_PER_PAGE + 1,
+        'row_index': position % ROWS_PER_PAGE + 1,
+        'sr_no': str(position + 1),
+        'term_id': cell('t_id'),
+        'parent_id': cell('parent_id'),
+        'code': cell('term_id'),
+        'word': cell('wordtree'),
+        'short_definition': cell('w_trans'),
+        'long_definition': cell('w_def'),
+        'reference': cell('refn'),
+        'extraction_timestamp': datetime.now().isoformat()
+    }
+
+def extract_pages_direct(json_backup=False):
+    """Extract pages 1042-1330 by slicing the full dataset from the JS data file (no browser)"""
+    
+    # The SAT-Combined table is paginated client-side by DataTables over the array in
+    # ayu_sat_table_combined.js - there is no server-side start/length endpoint to query.
+    # That file is the bulk interface: one GET returns every row of every page.
+    records = fetch_all_records()
+    if records is None:
+        return
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    csv_filename = f'namaste_pages_1042_1330_complete_{timestamp}.csv'
+    
+    start = (FIRST_PAGE - 1) * ROWS_PER_PAGE
+    end = LAST_PAGE * ROWS_PER_PAGE
+    all_extracted_data = [record_to_row(record, start + i) for i, record in enumerate(records[start:end])]
+    all_extracted_data = [row for row in all_extracted_data if row['term_id'] or row['code']]
+    all_extracted_data = Deduplicator().filter(all_extracted_data)
+    
+    df = pd.DataFrame(all_extracted_data)
+    df.to_csv(csv_filename, index=False, encoding='utf-8', chunksize=50_000)
+    parquet_filename = csv_filename.replace('.csv', '.parquet')
+    df.to_parquet(parquet_filename, compression='zstd')
+    
+    print(f"\n🎯 EXTRACTION COMPLETED!")
+    print(f"📊 FINAL SUMMARY:")
+    print(f"   Pages: {FIRST_PAGE}-{LAST_PAGE} ({ROWS_PER_PAGE} rows per page)")
+    print(f"   Total terms extracted: {len(all_extracted_data)}")
+    print(f"   CSV file: {csv_filename}")
+    print(f"💾 Parquet backup: {parquet_filename}")
+    
+    # Optional JSON backup
+    if json_backup:
+        json_filename = csv_filename.replace('.csv', '.json')
+        with open(json_filename, 'wb') as f:
+            f.write(orjson.dumps(all_extracted_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        print(f"💾 JSON backup: {json_filename}")
+
+def extract_pages_1042_1330(mode='direct', json_backup=False):
+    """Extract ALL data from pages 1042-1330"""
+    if mode == 'selenium':
+        extract_pages_selenium(json_backup)
+    else:
+        extract_pages_direct(json_backup)
+
+def extract_page(pool, page_num):
+    """Navigate a pooled driver to one page and extract it; returns (page_data, error)"""
+    with pool.driver() as driver:
+        if not navigate_to_specific_page(driver, page_num):
+            return None, "Navigation failed"
+        
+        # Extract ALL data from current page
+        page_data = extract_all_page_data(driver, page_num)
+    
+    return page_data, None
+
+def extract_pages_selenium(json_backup=False):
+    """Extract ALL data from pages 1042-1330 with a pool of Chrome drivers, with incremental saves"""
+    
+    print(f"🚀 Starting {BROWSER_POOL_SIZE} browsers on NAMASTE SAT-Combined...")
+    pool = BrowserPool(BROWSER_POOL_SIZE)
+    if not len(pool):
         return
     
     # Setup output file with timestamp
@@ -187,91 +436,98 @@ def extract_pages_1042_1330():
     csv_filename = f'namaste_pages_1042_1330_complete_{timestamp}.csv'
     progress_file = f'extraction_progress_{timestamp}.txt'
     
-    all_extracted_data = []
+    parquet_filename = csv_filename.replace('.csv', '.parquet')
+    
+    csv_writer = IncrementalCSVWriter(csv_filename)
+    parquet_writer = IncrementalParquetWriter(parquet_filename)
+    all_extracted_data = []  # only kept for the optional JSON backup
+    deduplicator = Deduplicator()
+    total_terms = 0
     successful_pages = []
     failed_pages = []
     
     try:
-        print("🚀 Navigating to NAMASTE SAT-Combined...")
-        driver.get("https://namaste.ayush.gov.in/sat_Ayurveda")
-        
-        # Click SAT-COMBINED tab
-        WebDriverWait(driver, 20).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'SAT-COMBINED')]"))
-        )
-        
-        sat_combined_tab = driver.find_element(By.XPATH, "//a[contains(text(), 'SAT-COMBINED')]")
-        driver.execute_script("arguments[0].click();", sat_combined_tab)
-        time.sleep(5)
-        
-        print(f"📊 Starting extraction from pages 1042-1330...")
+        print(f"📊 Starting extraction from pages 1042-1330 with {len(pool)} browsers...")
         print(f"💾 CSV file: {csv_filename}")
+        print(f"💾 Parquet file: {parquet_filename}")
         print(f"📝 Progress file: {progress_file}")
         
-        # Extract each page from 1042 to 1330
         total_pages = 1330 - 1042 + 1
         
-        for current_page in range(1042, 1331):
-            page_start_time = time.time()
+        # Pages are fetched concurrently; results are saved from this thread only
+        with ThreadPoolExecutor(max_workers=len(pool)) as executor:
+            page_starts = {}
+            futures = {}
+            for page_num in range(1042, 1331):
+                page_starts[page_num] = time.time()
+                futures[executor.submit(extract_page, pool, page_num)] = page_num
             
-            try:
-                print(f"\n📄 Processing page {current_page}...")
+            # Finished pages wait here until every earlier page is done, so the CSV,
+            # Parquet and JSON outputs are written (and de-duplicated) in page order
+            pending_pages = {}
+            next_page = 1042
+            
+            for future in as_completed(futures):
+                current_page = futures[future]
+                page_data = None
                 
-                # Navigate to specific page
-                if navigate_to_specific_page(driver, current_page):
-                    time.sleep(3)  # Wait for page load
+                try:
+                    page_data, error = future.result()
                     
-                    # Extract ALL data from current page
-                    page_data = extract_all_page_data(driver, current_page)
-                    
-                    if page_data:
-                        # Add to main dataset
-                        all_extracted_data.extend(page_data)
+                    if error:
+                        failed_pages.append(current_page)
+                        print(f"❌ Page {current_page}: {error}")
+                    elif page_data:
                         successful_pages.append(current_page)
-                        
-                        # SAVE INCREMENTALLY after each page
-                        if save_incremental_data(all_extracted_data, csv_filename):
-                            page_time = time.time() - page_start_time
-                            print(f"✅ Page {current_page}: {len(page_data)} terms extracted, CSV updated ({page_time:.1f}s)")
-                        else:
-                            print(f"⚠️ Page {current_page}: Data extracted but CSV save failed")
-                        
-                        # Save progress
-                        progress_info = {
-                            'last_completed_page': current_page,
-                            'total_terms_extracted': len(all_extracted_data),
-                            'successful_pages': len(successful_pages),
-                            'failed_pages': len(failed_pages),
-                            'timestamp': datetime.now().isoformat()
-                        }
-                        
-                        with open(progress_file, 'w') as f:
-                            json.dump(progress_info, f, indent=2)
-                        
+                        page_time = time.time() - page_starts[current_page]
+                        print(f"✅ Page {current_page}: {len(page_data)} terms extracted ({page_time:.1f}s)")
                     else:
                         failed_pages.append(current_page)
                         print(f"⚠️ Page {current_page}: No data found")
                 
-                else:
+                except Exception as e:
                     failed_pages.append(current_page)
-                    print(f"❌ Page {current_page}: Navigation failed")
+                    print(f"❌ Error on page {current_page}: {e}")
+                
+                pending_pages[current_page] = page_data or []
+                while next_page in pending_pages:
+                    # Drop rows already extracted from an earlier page
+                    page_rows = deduplicator.filter(pending_pages.pop(next_page))
+                    if page_rows:
+                        # Add to main dataset
+                        if json_backup:
+                            all_extracted_data.extend(page_rows)
+                        total_terms += len(page_rows)
+                        parquet_writer.write_page(page_rows)
+                        
+                        # SAVE INCREMENTALLY (append only)
+                        if not csv_writer.write_page(page_rows):
+                            print(f"⚠️ Page {next_page}: Data extracted but CSV save failed")
+                    next_page += 1
                 
                 # Progress update every 10 pages
-                if current_page % 10 == 0:
-                    progress_percent = ((current_page - 1042) / total_pages) * 100
+                pages_done = len(successful_pages) + len(failed_pages)
+                if pages_done % 10 == 0:
+                    progress_percent = (pages_done / total_pages) * 100
                     print(f"\n🔄 PROGRESS UPDATE:")
-                    print(f"   Completed: {progress_percent:.1f}% ({current_page - 1042}/{total_pages} pages)")
-                    print(f"   Total terms extracted: {len(all_extracted_data)}")
+                    print(f"   Completed: {progress_percent:.1f}% ({pages_done}/{total_pages} pages)")
+                    print(f"   Total terms extracted: {total_terms}")
                     print(f"   Successful pages: {len(successful_pages)}")
                     print(f"   Failed pages: {len(failed_pages)}")
-                
-                # Small delay between pages to be respectful
-                time.sleep(1)
-                
-            except Exception as e:
-                failed_pages.append(current_page)
-                print(f"❌ Error on page {current_page}: {e}")
-                continue
+                    
+                    # Save progress atomically so a crash never leaves a truncated file
+                    progress_info = {
+                        'last_completed_page': current_page,
+                        'total_terms_extracted': total_terms,
+                        'successful_pages': len(successful_pages),
+                        'failed_pages': len(failed_pages),
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    
+                    tmp_file = progress_file + '.tmp'
+                    with open(tmp_file, 'wb') as f:
+                        f.write(orjson.dumps(progress_info))
+                    os.replace(tmp_file, progress_file)
         
         # Final save and summary
         print(f"\n🎯 EXTRACTION COMPLETED!")
@@ -279,34 +535,48 @@ def extract_pages_1042_1330():
         print(f"   Total pages processed: {len(successful_pages) + len(failed_pages)}")
         print(f"   Successful pages: {len(successful_pages)}")
         print(f"   Failed pages: {len(failed_pages)}")
-        print(f"   Total terms extracted: {len(all_extracted_data)}")
+        print(f"   Total terms extracted: {total_terms}")
         print(f"   CSV file: {csv_filename}")
         
         if failed_pages:
+            failed_pages.sort()
             print(f"\n❌ FAILED PAGES: {failed_pages[:10]}{'...' if len(failed_pages) > 10 else ''}")
         
-        # Save final JSON backup
-        json_filename = csv_filename.replace('.csv', '.json')
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(all_extracted_data, f, ensure_ascii=False, indent=2)
-        print(f"💾 JSON backup: {json_filename}")
+        # Optional JSON backup, already in page order
+        if json_backup:
+            json_filename = csv_filename.replace('.csv', '.json')
+            with open(json_filename, 'wb') as f:
+                f.write(orjson.dumps(all_extracted_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            print(f"💾 JSON backup: {json_filename}")
         
     except Exception as e:
         print(f"❌ Critical error: {e}")
     
     finally:
-        print("🔒 Closing browser...")
-        driver.quit()
+        csv_writer.close()
+        parquet_writer.close()
+        print("🔒 Closing browsers...")
+        pool.close()
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="NAMASTE data extraction for pages 1042-1330")
+    parser.add_argument('--mode', choices=['direct', 'selenium'], default='direct',
+                        help="direct: slice the JS data file (default); selenium: page through the table in Chrome")
+    parser.add_argument('--json-backup', action='store_true',
+                        help="also write an indented JSON copy of all rows (Parquet is always written)")
+    args = parser.parse_args()
+    
     print("🎯 NAMASTE Complete Data Extraction (Pages 1042-1330)")
     print("📊 Extracting ALL data (no filtering)")
-    print("💾 Incremental CSV saves after each page")
-    print("🔒 Running in HEADLESS mode")
+    if args.mode == 'selenium':
+        print("💾 Incremental CSV saves after each page")
+        print("🔒 Running in HEADLESS mode")
+    else:
+        print("⚡ Direct mode: single download, no browser")
     print("=" * 60)
     
-    extract_pages_1042_1330()
+    extract_pages_1042_1330(args.mode, args.json_backup)
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,65 @@
 # extract_working.py - Simple working parser for ALL records
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
 import pandas as pd
 from datetime import datetime
 
-def extract_all_records():
-    """Extract all 14,968 records from the JavaScript file"""
-    print("🚀 NAMASTE Complete Extraction - All 14,968 Records")
+SAT_COMBINED_JS_URL = "https://namaste.ayush.gov.in/admin/js/codes/ayu_sat_table_combined.js"
+JSON_START = b'[{"rec_id":1'  # Start of JSON array
+
+# Shared keep-alive session with retries on transient server errors
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                       max_retries=Retry(total=5, backoff_factor=0.5,
+                                         status_forcelist=[429, 500, 502, 503, 504]))
+session.mount('http://', _adapter)
+session.mount('https://', _adapter)
+
+class Deduplicator:
+    """Drop rows whose key fields were already seen, keeping only the keys in memory"""
+    
+    def __init__(self, key_fields=('term_id', 'code')):
+        self.key_fields = key_fields
+        self.seen = set()
+    
+    def filter(self, rows):
+        unique_rows = []
+        for row in rows:
+            key = tuple(row.get(field) for field in self.key_fields)
+            if key not in self.seen:
+                self.seen.add(key)
+                unique_rows.append(row)
+        return unique_rows
+
+def fetch_all_records():
+    """Download the SAT-Combined JavaScript file and parse its records (None on failure)"""
     print("📥 Downloading JavaScript file...")
     
-    js_url = "https://namaste.ayush.gov.in/admin/js/codes/ayu_sat_table_combined.js"
+    js_url = SAT_COMBINED_JS_URL
     
     try:
-        response = requests.get(js_url, timeout=60)  # Longer timeout
-        content = response.text
-        print(f"✅ Downloaded {len(content):,} characters")
+        # Stream the body, keeping only bytes from the start of the JSON array onwards
+        response = session.get(js_url, stream=True, timeout=(10, 60),  # Connect, read
+                               headers={'Accept-Encoding': DEFAULT_ACCEPT_ENCODING})
+        response.raise_for_status()
+        
+        content = bytearray()
+        json_start = -1
+        downloaded = 0
+        for chunk in response.iter_content(chunk_size=1 << 16):
+            downloaded += len(chunk)
+            content += chunk
+            if json_start < 0:
+                json_start = content.find(JSON_START)
+                if json_start >= 0:
+                    del content[:json_start]
+                else:
+                    # Keep a tail in case the marker straddles two chunks
+                    del content[:max(0, len(content) - len(JSON_START) + 1)]
+        print(f"✅ Downloaded {downloaded:,} bytes")
     except Exception as e:
         print(f"❌ Download error: {e}")
         return
@@ -23,15 +68,14 @@ def extract_all_records():
     
     try:
         # We know exactly where the JSON starts and ends from debug
-        json_start = content.find('[{"rec_id":1')  # Start of JSON array
-        json_end = content.rfind('}]') + 2  # End of JSON array
+        json_end = content.rfind(b'}]') + 2  # End of JSON array
         
-        if json_start >= 0 and json_end > json_start:
-            json_str = content[json_start:json_end]
-            print(f"✅ Found JSON data: {len(json_str):,} characters")
+        if json_start >= 0 and json_end > 1:
+            del content[json_end:]
+            print(f"✅ Found JSON data: {len(content):,} bytes")
             
             print("🔄 Parsing JSON (this may take a moment)...")
-            data = json.loads(json_str)
+            data = json.loads(content)
             
             print(f"✅ Successfully parsed {len(data):,} records!")
             
@@ -46,11 +90,24 @@ def extract_all_records():
         print(f"❌ Extraction error: {e}")
         return
     
+    return data
+
+def extract_all_records():
+    """Extract all 14,968 records from the JavaScript file"""
+    print("🚀 NAMASTE Complete Extraction - All 14,968 Records")
+    
+    data = fetch_all_records()
+    if data is None:
+        return
+    
+    # Raw records carry the numeric id in t_id and the code in term_id
+    data = Deduplicator(('t_id', 'term_id')).filter(data)
+    
     print("📊 Converting to DataFrame...")
     
     try:
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        # Convert to DataFrame with Arrow-backed columns (compact strings)
+        df = pd.DataFrame(data).convert_dtypes(dtype_backend='pyarrow')
         df['extraction_timestamp'] = datetime.now().isoformat()
         
         print(f"✅ DataFrame created:")
@@ -70,7 +127,7 @@ def extract_all_records():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f'namaste_complete_all_{timestamp}.csv'
         
-        df.to_csv(filename, index=False, encoding='utf-8')
+        df.to_csv(filename, index=False, encoding='utf-8', chunksize=10_000)
         
         print(f"✅ EXTRACTION SUCCESSFUL!")
         print(f"📁 File: {filename}")
@@ -88,7 +145,8 @@ def extract_all_records():
         
         # Show term_id patterns
         if 'term_id' in df.columns:
-            unique_prefixes = df['term_id'].str.split('.').str[0].value_counts().head(10)
+            term_id_prefix = df['term_id'].str.extract(r'^(?P<prefix>[^.]+)', expand=False).astype('category')
+            unique_prefixes = term_id_prefix.value_counts().head(10)
             print(f"   Top term_id prefixes:")
             for prefix, count in unique_prefixes.items():
                 print(f"      {prefix}: {count} terms")
@@ -2,23 +2,34 @@
 import subprocess
 import sys
 import os
+import tempfile
 
 def install_packages():
     """Install required packages"""
     packages = [
         'selenium==4.15.0',
         'pandas==2.1.3',
+        'pyarrow==14.0.1',
+        'orjson==3.9.10',
         'openpyxl==3.1.2',
         'requests==2.31.0',
-        'beautifulsoup4==4.12.2'
+        'beautifulsoup4==4.12.2',
+        'lxml==4.9.3'
     ]
     
-    for package in packages:
-        try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-            print(f"✅ Installed {package}")
-        except subprocess.CalledProcessError:
-            print(f"❌ Failed to install {package}")
+    # One pip run resolves the whole set at once instead of once per package
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write('\n'.join(packages) + '\n')
+        requirements_file = f.name
+    
+    try:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--no-input',
+                               '--prefer-binary', '-r', requirements_file])
+        print(f"✅ Installed {', '.join(packages)}")
+    except subprocess.CalledProcessError:
+        print(f"❌ Failed to install packages from {requirements_file}")
+    finally:
+        os.remove(requirements_file)
 
 def setup_chromedriver():
     """Setup ChromeDriver"""
@@ -6,67 +6,150 @@ Discovers exact CID-to-Unicode mappings + Creates complete trilingual dataset
 For multilingual AI models - Arabic preservation is ESSENTIAL
 """
 
-import json
+import csv
+import os
 import re
 import unicodedata
 from datetime import datetime
-from typing import Dict, List, Tuple, Set
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple, Set
+import numpy as np
+import orjson
 import pandas as pd
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    try:
+        import fitz as pymupdf
+        PYMUPDF_AVAILABLE = True
+    except ImportError:
+        PYMUPDF_AVAILABLE = False
+
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
 
 try:
     import pdfplumber
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdftypes import resolve1
+    from pdfminer.psparser import literal_name
     PDFPLUMBER_AVAILABLE = True
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
-def extract_font_information_and_cid_patterns(pdf_path: str) -> Dict:
+# Text-only extraction backends. pdfplumber stays the default because it is the one that renders
+# unmapped glyphs as "(cid:N)" markers and keeps table rows on one line; PyMuPDF/pypdfium2 are much
+# faster and are used when pdfplumber is missing or when the PDF's fonts map cleanly to Unicode
+PDF_BACKENDS = {'pdfplumber': PDFPLUMBER_AVAILABLE, 'pymupdf': PYMUPDF_AVAILABLE, 'pypdfium2': PYPDFIUM2_AVAILABLE}
+DEFAULT_PDF_BACKEND = next((backend for backend, available in PDF_BACKENDS.items() if available), None)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+EMPTY_CONTEXT = {}  # shared read-only default for terms without CID context
+TERMINOLOGY_START_PAGE = 27  # 0-based index of the first terminology page
+PAGE_BATCH_SIZE = 8  # pages analysed per worker task
+
+# Patterns used in the per-line hot loops, compiled once
+_UMI_RE = re.compile(r'UMI-(\d{4})')
+_UMI_ANY_RE = re.compile(r'UMI-\d{4}')
+_CID_RE = re.compile(r'\(cid:\d+\)')
+_MIXED_RE = re.compile(r'[a-zA-Z0-9_~]*\(cid:\d+\)[a-zA-Z0-9_~]*')
+_CHARSEQ_RE = re.compile(r'[a-zA-Z_~][a-zA-Z0-9_~]*')
+_WS_RE = re.compile(r'\s+')
+
+class _ControlCharTable(dict):
+    """str.translate table dropping Unicode category C* characters, filled in per code point as seen"""
+    
+    def __missing__(self, codepoint):
+        mapped = None if unicodedata.category(chr(codepoint))[0] == 'C' else codepoint
+        self[codepoint] = mapped
+        return mapped
+
+_CONTROL_CHARS = _ControlCharTable()
+# Any CID code (with or without surrounding letters), unusual character sequences,
+# capital + lowercase + number, or numbers + letters - one scan per token
+_ENCODED_RE = re.compile(r'\(cid:\d+\)|[vwxyzVWXYZ_~]{2,}|[A-Z][a-z]*[0-9]|[0-9]+[a-zA-Z]')
+
+# Description keywords per category, checked in order - the first category with any keyword wins
+SEMANTIC_CATEGORIES = {
+    'anatomy': ['body', 'organ', 'structure', 'part', 'limb'],
+    'physiology': ['function', 'process', 'system', 'mechanism'],
+    'pathology': ['disease', 'condition', 'disorder', 'illness', 'infection'],
+    'pharmacology': ['medicine', 'drug', 'treatment', 'remedy', 'therapy'],
+    'diagnosis': ['examination', 'test', 'assessment', 'evaluation'],
+    'geography': ['zone', 'region', 'area', 'place', 'location'],
+    'philosophy': ['logic', 'reasoning', 'thought', 'mind', 'concept']
+}
+MEDICAL_DOMAINS = {
+    'unani_medicine': ['unani', 'tibb', 'traditional'],
+    'basic_sciences': ['anatomy', 'physiology', 'logic', 'philosophy'],
+    'clinical_medicine': ['diagnosis', 'treatment', 'patient', 'clinical'],
+    'pathology': ['disease', 'pathology', 'condition', 'disorder'],
+    'pharmacology': ['medicine', 'drug', 'pharmaceutical', 'remedy']
+}
+
+def build_keyword_matcher(categories: Dict[str, List[str]]):
+    """Aho-Corasick automaton over all keywords (value: category priority, name), else one regex per category"""
+    if not AHOCORASICK_AVAILABLE:
+        return {category: re.compile('|'.join(keywords)) for category, keywords in categories.items()}
+    
+    automaton = ahocorasick.Automaton()
+    for priority, (category, keywords) in enumerate(categories.items()):
+        for keyword in keywords:
+            if keyword not in automaton:
+                automaton.add_word(keyword, (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+_SEMANTIC_CATEGORY_MATCHER = build_keyword_matcher(SEMANTIC_CATEGORIES)
+_MEDICAL_DOMAIN_MATCHER = build_keyword_matcher(MEDICAL_DOMAINS)
+
+def extract_font_information_and_cid_patterns(pdf_path: str, backend: Optional[str] = None) -> Dict:
     """
     STEP 1: Extract font information and discover all CID patterns
     This builds the foundation for exact mapping discovery
     """
     
-    if not PDFPLUMBER_AVAILABLE:
-        print("❌ pdfplumber required for font analysis")
+    backend = backend or DEFAULT_PDF_BACKEND
+    if not PDF_BACKENDS.get(backend):
+        print("❌ pdfplumber, PyMuPDF or pypdfium2 required for font analysis")
         return {}
     
     print("🔍 PRECISION FONT ANALYSIS - Discovering CID Patterns")
     print("=" * 60)
     
-    font_analysis = {
-        'font_info': {},
-        'cid_patterns': defaultdict(list),
-        'character_patterns': defaultdict(list),
-        'transliteration_context': {},
-        'frequency_analysis': Counter(),
-        'sample_contexts': {}
-    }
+    font_analysis = new_font_analysis()
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"📄 Analyzing {total_pages} pages for font patterns...")
-            
-            for page_num, page in enumerate(pdf.pages):
-                if page_num < 27:  # Skip to terminology section
-                    continue
-                
-                # Extract font information from page
-                try:
-                    if hasattr(page, 'fonts'):
-                        for font_info in page.fonts:
-                            font_name = font_info.get('name', 'unknown')
-                            font_analysis['font_info'][font_name] = font_info
-                except:
-                    pass
-                
-                # Extract and analyze text patterns
-                page_text = page.extract_text()
-                if page_text:
-                    analyze_page_patterns(page_text, page_num + 1, font_analysis)
+        total_pages = count_pdf_pages(pdf_path, backend)
+        print(f"📄 Analyzing {total_pages} pages for font patterns ({backend})...")
+        
+        # Pages are independent - analyse batches in worker processes and merge in page order
+        page_numbers = list(range(TERMINOLOGY_START_PAGE, total_pages))
+        batches = [page_numbers[i:i + PAGE_BATCH_SIZE] for i in range(0, len(page_numbers), PAGE_BATCH_SIZE)]
+        next_report = 0
+        
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for batch, batch_analysis in zip(batches, executor.map(partial(analyze_page_batch, pdf_path, backend), batches)):
+                merge_font_analysis(font_analysis, batch_analysis)
                 
-                if page_num % 25 == 0 and page_num > 27:
-                    print(f"📈 Analyzed {page_num + 1}/{total_pages} pages")
+                if batch[-1] >= next_report:
+                    next_report = batch[-1] + 25
+                    print(f"📈 Analyzed {batch[-1] + 1}/{total_pages} pages")
                     print(f"   • CID patterns found: {len(font_analysis['cid_patterns'])}")
                     print(f"   • Character patterns: {len(font_analysis['character_patterns'])}")
     
@@ -78,6 +161,121 @@ def extract_font_information_and_cid_patterns(pdf_path: str) -> Dict:
     
     return font_analysis
 
+def new_pattern_occurrences() -> Dict[str, List]:
+    """Column-wise occurrence lists for one CID pattern"""
+    return {'umi_code': [], 'page': []}
+
+def new_font_analysis() -> Dict:
+    """Empty font analysis structure"""
+    return {
+        'font_info': {},
+        'cid_patterns': defaultdict(new_pattern_occurrences),
+        'character_patterns': defaultdict(list),
+        'transliteration_context': {},
+        'frequency_analysis': Counter(),
+        'sample_contexts': {}
+    }
+
+def count_pdf_pages(pdf_path: str, backend: str) -> int:
+    """Number of pages in the PDF"""
+    if backend == 'pymupdf':
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    if backend == 'pypdfium2':
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    # Read the count from the page tree root - len(pdf.pages) would build a Page object per page
+    with open(pdf_path, 'rb') as fp:
+        return resolve1(PDFDocument(PDFParser(fp)).catalog['Pages'])['Count']
+
+def pdfminer_page_fonts(page) -> List[Dict]:
+    """Font names and types from a pdfminer page's resources"""
+    fonts = []
+    try:
+        for font_spec in resolve1(page.resources.get('Font', {})).values():
+            font_spec = resolve1(font_spec)
+            fonts.append({
+                'name': literal_name(font_spec.get('BaseFont', 'unknown')),
+                'type': literal_name(font_spec.get('Subtype', 'unknown'))
+            })
+    except:
+        pass
+    return fonts
+
+def read_pdf_pages(pdf_path: str, page_numbers: List[int], backend: str) -> Iterator[Tuple[int, str, List[Dict]]]:
+    """Yield (page number, text, fonts) for the given 0-based pages, loading only those pages"""
+    if backend == 'pymupdf':
+        with pymupdf.open(pdf_path) as doc:
+            for page_num in page_numbers:
+                page = doc[page_num]
+                fonts = [{'xref': xref, 'type': font_type, 'name': basefont, 'encoding': encoding}
+                         for xref, _, font_type, basefont, _, encoding, *_ in page.get_fonts()]
+                yield page_num, page.get_text("text"), fonts
+    
+    elif backend == 'pypdfium2':
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page_num in page_numbers:
+                page = pdf[page_num]
+                textpage = page.get_textpage()
+                yield page_num, textpage.get_text_range().replace('\r\n', '\n'), []
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+    
+    else:
+        # One open per batch: pdfplumber shares the document's resource manager (and its font cache)
+        # across these pages; closing each page drops its parsed layout objects before the next one
+        with pdfplumber.open(pdf_path, pages=[page_num + 1 for page_num in page_numbers]) as pdf:
+            for page_num, page in zip(page_numbers, pdf.pages):
+                text, fonts = page.extract_text(), pdfminer_page_fonts(page.page_obj)
+                page.close()
+                yield page_num, text, fonts
+
+def analyze_page_batch(pdf_path: str, backend: str, page_numbers: List[int]) -> Dict:
+    """
+    Analyze a batch of pages (0-based indices) in a worker process
+    Only these pages are loaded from the PDF
+    """
+    
+    analysis = new_font_analysis()
+    
+    for page_num, page_text, fonts in read_pdf_pages(pdf_path, page_numbers, backend):
+        # Extract font information from page
+        try:
+            for font_info in fonts:
+                font_name = font_info.get('name', 'unknown')
+                analysis['font_info'][font_name] = font_info
+        except:
+            pass
+        
+        # Extract and analyze text patterns
+        if page_text:
+            analyze_page_patterns(page_text, page_num + 1, analysis)
+    
+    return analysis
+
+def merge_font_analysis(analysis: Dict, batch_analysis: Dict):
+    """Merge a batch result into the running analysis (batches must arrive in page order)"""
+    analysis['font_info'].update(batch_analysis['font_info'])
+    for pattern, occurrences in batch_analysis['cid_patterns'].items():
+        merged = analysis['cid_patterns'][pattern]
+        merged['umi_code'].extend(occurrences['umi_code'])
+        merged['page'].extend(occurrences['page'])
+    for pattern, occurrences in batch_analysis['character_patterns'].items():
+        analysis['character_patterns'][pattern].extend(occurrences)
+    analysis['transliteration_context'].update(batch_analysis['transliteration_context'])
+    analysis['frequency_analysis'].update(batch_analysis['frequency_analysis'])
+    
+    samples = analysis['sample_contexts']
+    for umi_code, context in batch_analysis['sample_contexts'].items():
+        if len(samples) < 50:  # Keep 50 samples
+            samples[umi_code] = context
+
 def analyze_page_patterns(text: str, page_num: int, analysis: Dict):
     """
     Analyze patterns on each page to build CID mapping intelligence
@@ -85,47 +283,43 @@ def analyze_page_patterns(text: str, page_num: int, analysis: Dict):
     
     lines = text.split('\n')
     
-    for i, line in enumerate(lines):
-        line = line.strip()
+    # Look for UMI codes - scanned once per page, the line set also bounds descriptions
+    umi_matches = [(i, _UMI_RE.search(line)) for i, line in enumerate(lines)]
+    umi_matches = [(i, umi_match) for i, umi_match in umi_matches if umi_match]
+    umi_lines = {i for i, _ in umi_matches}
+    
+    for i, umi_match in umi_matches:
+        umi_code = f"UMI-{umi_match.group(1)}"
         
-        # Look for UMI codes
-        umi_match = re.search(r'UMI-(\d{4})', line)
-        if umi_match:
-            umi_code = f"UMI-{umi_match.group(1)}"
-            
-            # Extract the complete context around UMI code
-            context = extract_complete_context(lines, i, umi_code)
+        # Extract the complete context around UMI code
+        context = extract_complete_context(lines, i, umi_code, umi_lines)
+        
+        if context:
+            # Find CID patterns
+            cid_patterns = extract_all_cid_patterns(context['cid_text'])
             
-            if context:
-                # Find CID patterns
-                cid_patterns = extract_all_cid_patterns(context['cid_text'])
-                
-                # Store patterns with context
-                for pattern in cid_patterns:
-                    analysis['cid_patterns'][pattern].append({
-                        'umi_code': umi_code,
-                        'page': page_num,
-                        'transliteration': context.get('transliteration', ''),
-                        'description': context.get('description', ''),
-                        'full_context': context
-                    })
-                    
-                    # Track frequency
-                    analysis['frequency_analysis'][pattern] += 1
+            # Store pattern occurrences (full contexts are kept in sample_contexts)
+            for pattern in cid_patterns:
+                occurrences = analysis['cid_patterns'][pattern]
+                occurrences['umi_code'].append(umi_code)
+                occurrences['page'].append(page_num)
                 
-                # Store transliteration context for pattern learning
-                if context.get('transliteration') and context.get('cid_text'):
-                    analysis['transliteration_context'][umi_code] = {
-                        'cid_text': context['cid_text'],
-                        'transliteration': context['transliteration'],
-                        'page': page_num
-                    }
-                
-                # Store sample for manual review
-                if len(analysis['sample_contexts']) < 50:  # Keep 50 samples
-                    analysis['sample_contexts'][umi_code] = context
+                # Track frequency
+                analysis['frequency_analysis'][pattern] += 1
+            
+            # Store transliteration context for pattern learning
+            if context.get('transliteration') and context.get('cid_text'):
+                analysis['transliteration_context'][umi_code] = {
+                    'cid_text': context['cid_text'],
+                    'transliteration': context['transliteration'],
+                    'page': page_num
+                }
+            
+            # Store sample for manual review
+            if len(analysis['sample_contexts']) < 50:  # Keep 50 samples
+                analysis['sample_contexts'][umi_code] = context
 
-def extract_complete_context(lines: List[str], line_index: int, umi_code: str) -> Dict:
+def extract_complete_context(lines: List[str], line_index: int, umi_code: str, umi_lines: Set[int]) -> Dict:
     """
     Extract complete context around UMI code including CID text, transliteration, description
     """
@@ -133,7 +327,7 @@ def extract_complete_context(lines: List[str], line_index: int, umi_code: str) -
     current_line = lines[line_index]
     
     # Remove UMI code to get the rest
-    line_without_umi = re.sub(r'UMI-\d{4}', '', current_line).strip()
+    line_without_umi = _UMI_ANY_RE.sub('', current_line).strip()
     
     # Split line into parts
     parts = line_without_umi.split()
@@ -163,64 +357,36 @@ def extract_complete_context(lines: List[str], line_index: int, umi_code: str) -
     description_parts = []
     for i in range(line_index + 1, min(line_index + 5, len(lines))):
         next_line = lines[i].strip()
-        if next_line and not re.search(r'UMI-\d{4}', next_line):
-            description_parts.append(next_line)
-        else:
+        if i in umi_lines or not next_line:
             break
+        description_parts.append(next_line)
     
     if description_parts:
         context['description'] = ' '.join(description_parts)
     
     return context
 
+@lru_cache(maxsize=32768)
 def contains_cid_or_encoded_chars(text: str) -> bool:
     """
     Enhanced detection for CID patterns and encoded characters
     """
-    if not text:
-        return False
-    
-    # Explicit CID patterns
-    if re.search(r'\(cid:\d+\)', text):
-        return True
-    
-    # Mixed patterns
-    encoded_patterns = [
-        r'[a-zA-Z]+\(cid:\d+\)',   # Letters + CID
-        r'\(cid:\d+\)[a-zA-Z]+',   # CID + letters  
-        r'[vwxyzVWXYZ_~]{2,}',     # Unusual character sequences
-        r'[A-Z][a-z]*[0-9]',       # Capital + lowercase + number
-        r'[0-9]+[a-zA-Z]',         # Numbers + letters
-    ]
-    
-    for pattern in encoded_patterns:
-        if re.search(pattern, text):
-            return True
-    
-    return False
+    return bool(text) and _ENCODED_RE.search(text) is not None
 
-def extract_all_cid_patterns(text: str) -> List[str]:
+@lru_cache(maxsize=32768)
+def extract_all_cid_patterns(text: str) -> Tuple[str, ...]:
     """
-    Extract all CID patterns from text
+    Extract all CID patterns from text (cached per token, so returns a tuple)
     """
-    patterns = []
-    
     if not text:
-        return patterns
-    
-    # Explicit CID codes
-    cid_codes = re.findall(r'\(cid:\d+\)', text)
-    patterns.extend(cid_codes)
-    
-    # Character sequences
-    char_sequences = re.findall(r'[a-zA-Z_~][a-zA-Z0-9_~]*', text)
-    patterns.extend(char_sequences)
-    
-    # Mixed patterns
-    mixed_patterns = re.findall(r'[a-zA-Z0-9_~]*\(cid:\d+\)[a-zA-Z0-9_~]*', text)
-    patterns.extend(mixed_patterns)
-    
-    return list(set(patterns))  # Remove duplicates
+        return ()
+    
+    # Explicit CID codes, character sequences, mixed patterns - deduplicated in first-seen order
+    return tuple(dict.fromkeys(chain(
+        _CID_RE.findall(text),
+        _CHARSEQ_RE.findall(text),
+        _MIXED_RE.findall(text)
+    )))
 
 def build_cid_mapping_intelligence(font_analysis: Dict) -> Dict[str, str]:
     """
@@ -306,7 +472,7 @@ def create_cid_mapping_from_pattern(cid_text: str, target_arabic: str) -> Dict[s
     mapping = {}
     
     # Extract CID codes from text
-    cid_codes = re.findall(r'\(cid:\d+\)', cid_text)
+    cid_codes = _CID_RE.findall(cid_text)
     
     if cid_codes and target_arabic:
         # Simple mapping - would need sophisticated analysis for accuracy
@@ -347,41 +513,75 @@ def build_comprehensive_multilingual_dataset(font_analysis: Dict, mapping_intell
             'unicode_compliant': True
         },
         'font_analysis': font_analysis,
-        'mapping_intelligence': mapping_intelligence,
-        'terms': []
+        'mapping_intelligence': mapping_intelligence
     }
     
     print("🔄 Processing all terms for multilingual AI model...")
     
-    for index, row in excel_df.iterrows():
-        umi_code = str(row['CODE']).strip()
+    # Terms are written out as they are built; only running statistics stay in memory
+    writer = MultilingualDatasetWriter(font_analysis, mapping_intelligence)
+    statistics = DatasetStatistics()
+    try:
+        for term in iter_multilingual_terms(excel_df, font_analysis, mapping_intelligence):
+            writer.write_term(term)
+            statistics.add(term)
+        
+        # Calculate dataset statistics
+        calculate_dataset_statistics(multilingual_dataset, statistics)
+    finally:
+        multilingual_dataset['files'] = writer.close(multilingual_dataset['metadata'])
+    
+    print(f"✅ Multilingual dataset complete!")
+    print(f"📊 {statistics.total_terms} terms with Arabic preservation")
+    
+    return multilingual_dataset
+
+def iter_multilingual_terms(excel_df: pd.DataFrame, font_analysis: Dict, mapping_intelligence: Dict):
+    """Yield one multilingual term structure per Excel row"""
+    
+    # Per-term features computed column-wise up front
+    excel_df['umi_number'] = excel_df['CODE'].str.extract(r'-(\d{4})', expand=False).astype(int)
+    excel_df['translit_clean'] = excel_df['TRANSLITERATION'].map(clean_text)
+    excel_df['desc_clean'] = excel_df['DESCRIPTION'].map(clean_text)
+    excel_df['semantic_category'] = extract_semantic_category(excel_df['DESCRIPTION'])
+    excel_df['medical_domain'] = extract_medical_domain(excel_df['DESCRIPTION'])
+    
+    # Lengths and presence measured once, shared by complexity and quality scoring
+    excel_df['desc_len'] = excel_df['DESCRIPTION'].astype(str).str.len()
+    translit_words = excel_df['TRANSLITERATION'].astype(str).str.split().str.len()
+    excel_df['has_translit'] = excel_df['TRANSLITERATION'].notna() & (excel_df['TRANSLITERATION'].astype(str) != '')
+    excel_df['complexity_level'] = calculate_complexity_level(excel_df['desc_len'], translit_words)
+    
+    transliteration_context = font_analysis['transliteration_context']
+    
+    for row in excel_df.itertuples(index=False):
+        umi_code = row.CODE
         
         # Get CID analysis for this term
-        cid_context = font_analysis['transliteration_context'].get(umi_code, {})
+        cid_context = transliteration_context.get(umi_code, EMPTY_CONTEXT)
+        cid_text = cid_context.get('cid_text', '')
+        has_cid = bool(cid_text)
         
         # Build comprehensive term structure
         term = {
             'code': umi_code,
-            'umi_number': int(umi_code.split('-')[1]) if '-' in umi_code else 0,
+            'umi_number': row.umi_number,
             
             # MULTILINGUAL CONTENT
             'languages': {
                 'arabic_urdu': {
-                    'original_script': decode_cid_with_intelligence(
-                        cid_context.get('cid_text', ''), 
-                        mapping_intelligence
-                    ),
-                    'raw_cid': cid_context.get('cid_text', ''),
+                    'original_script': decode_cid_with_intelligence(cid_text, mapping_intelligence),
+                    'raw_cid': cid_text,
                     'encoding_method': 'cid_font_decoded',
                     'script_direction': 'rtl'
                 },
                 'transliteration': {
-                    'text': clean_text(row['TRANSLITERATION']),
+                    'text': row.translit_clean,
                     'system': 'scientific_transliteration',
                     'script_direction': 'ltr'
                 },
                 'english': {
-                    'description': clean_text(row['DESCRIPTION']),
+                    'description': row.desc_clean,
                     'type': 'medical_definition',
                     'script_direction': 'ltr'
                 }
@@ -389,13 +589,13 @@ def build_comprehensive_multilingual_dataset(font_analysis: Dict, mapping_intell
             
             # AI MODEL FEATURES
             'ai_features': {
-                'semantic_category': extract_semantic_category(row['DESCRIPTION']),
-                'medical_domain': extract_medical_domain(row['DESCRIPTION']),
-                'complexity_level': calculate_complexity_level(row),
+                'semantic_category': row.semantic_category,
+                'medical_domain': row.medical_domain,
+                'complexity_level': row.complexity_level,
                 'multilingual_quality_score': calculate_multilingual_quality(
-                    cid_context.get('cid_text', ''),
-                    row['TRANSLITERATION'],
-                    row['DESCRIPTION']
+                    has_cid,
+                    row.has_translit,
+                    row.desc_len
                 )
             },
             
@@ -404,36 +604,25 @@ def build_comprehensive_multilingual_dataset(font_analysis: Dict, mapping_intell
                 'page_number': cid_context.get('page', 0),
                 'extraction_method': 'hybrid_cid_excel_analysis',
                 'confidence_scores': {
-                    'arabic_script': 0.8 if cid_context.get('cid_text') else 0.0,
-                    'transliteration': 0.95 if row['TRANSLITERATION'] else 0.0,
-                    'english_definition': 0.98 if row['DESCRIPTION'] else 0.0
+                    'arabic_script': 0.8 if has_cid else 0.0,
+                    'transliteration': 0.95 if row.TRANSLITERATION else 0.0,
+                    'english_definition': 0.98 if row.DESCRIPTION else 0.0
                 }
             }
         }
         
-        multilingual_dataset['terms'].append(term)
-    
-    # Calculate dataset statistics
-    calculate_dataset_statistics(multilingual_dataset)
-    
-    print(f"✅ Multilingual dataset complete!")
-    print(f"📊 {len(multilingual_dataset['terms'])} terms with Arabic preservation")
-    
-    return multilingual_dataset
+        yield term
 
 def decode_cid_with_intelligence(cid_text: str, mapping_intelligence: Dict[str, str]) -> str:
     """
     Decode CID text using intelligent mapping
     """
-    if not cid_text:
+    if not cid_text or not mapping_intelligence:
         return ""
     
-    decoded = cid_text
-    
-    # Apply intelligent mappings
-    for cid_pattern, arabic_char in mapping_intelligence.items():
-        if cid_pattern in decoded:
-            decoded = decoded.replace(cid_pattern, arabic_char)
+    # Apply intelligent mappings - every key is a "(cid:N)" code, so one pass over
+    # the CID tokens with a dict lookup each replaces a str.replace per mapping
+    decoded = _CID_RE.sub(lambda match: mapping_intelligence.get(match.group(0), match.group(0)), cid_text)
     
     return decoded if decoded != cid_text else ""
 
@@ -442,7 +631,7 @@ def load_excel_structure(excel_path: str) -> pd.DataFrame:
     try:
         df = pd.read_excel(excel_path)
         df.columns = ['CODE', 'TERM', 'TRANSLITERATION', 'DESCRIPTION']
-        df = df[df['CODE'].astype(str).str.contains(r'UMI-\d{4}', na=False, regex=True)]
+        df = df[df['CODE'].astype(str).str.contains(_UMI_ANY_RE, na=False, regex=True)]
         df = df.dropna(subset=['CODE'])
         df['CODE'] = df['CODE'].astype(str).str.extract(r'(UMI-\d{4})')[0]
         df = df.dropna(subset=['CODE'])
@@ -456,180 +645,184 @@ def clean_text(text) -> str:
     if not text or pd.isna(text):
         return ""
     text_str = str(text)
-    cleaned = ''.join(char for char in text_str if unicodedata.category(char)[0] != 'C')
-    return re.sub(r'\s+', ' ', cleaned.strip())
-
-def extract_semantic_category(description: str) -> str:
-    """Extract semantic category from description"""
-    if not description:
-        return "unknown"
-    
-    desc_lower = description.lower()
-    
-    categories = {
-        'anatomy': ['body', 'organ', 'structure', 'part', 'limb'],
-        'physiology': ['function', 'process', 'system', 'mechanism'],
-        'pathology': ['disease', 'condition', 'disorder', 'illness', 'infection'],
-        'pharmacology': ['medicine', 'drug', 'treatment', 'remedy', 'therapy'],
-        'diagnosis': ['examination', 'test', 'assessment', 'evaluation'],
-        'geography': ['zone', 'region', 'area', 'place', 'location'],
-        'philosophy': ['logic', 'reasoning', 'thought', 'mind', 'concept']
-    }
-    
-    for category, keywords in categories.items():
-        if any(keyword in desc_lower for keyword in keywords):
-            return category
-    
-    return "general_medical"
+    cleaned = text_str if text_str.isprintable() else text_str.translate(_CONTROL_CHARS)
+    return _WS_RE.sub(' ', cleaned.strip())
 
-def extract_medical_domain(description: str) -> str:
-    """Extract medical domain"""
-    if not description:
-        return "general"
-    
-    desc_lower = description.lower()
-    
-    domains = {
-        'unani_medicine': ['unani', 'tibb', 'traditional'],
-        'basic_sciences': ['anatomy', 'physiology', 'logic', 'philosophy'],
-        'clinical_medicine': ['diagnosis', 'treatment', 'patient', 'clinical'],
-        'pathology': ['disease', 'pathology', 'condition', 'disorder'],
-        'pharmacology': ['medicine', 'drug', 'pharmaceutical', 'remedy']
-    }
-    
-    for domain, keywords in domains.items():
-        if any(keyword in desc_lower for keyword in keywords):
-            return domain
-    
-    return "general_medical"
+def first_keyword_category(automaton, text: str, default: str) -> str:
+    """Single automaton pass; the earliest-listed category among all keyword hits wins"""
+    best = None
+    for _, hit in automaton.iter(text):
+        if best is None or hit[0] < best[0]:
+            best = hit
+            if hit[0] == 0:
+                break
+    return best[1] if best else default
 
-def calculate_complexity_level(row) -> str:
-    """Calculate complexity level"""
-    description = str(row.get('DESCRIPTION', ''))
-    transliteration = str(row.get('TRANSLITERATION', ''))
-    
-    if len(description) > 200 or len(transliteration.split()) > 3:
-        return "complex"
-    elif len(description) > 100 or len(transliteration.split()) > 2:
-        return "medium"
-    else:
-        return "simple"
+def match_keyword_categories(descriptions: pd.Series, matcher, default: str, missing: str) -> np.ndarray:
+    """Label each description with the first category whose keywords it contains"""
+    desc_lower = descriptions.astype(str).str.lower()
+    empty = descriptions.isna() | (desc_lower == '')
+    
+    if AHOCORASICK_AVAILABLE:
+        labels = desc_lower.map(lambda text: first_keyword_category(matcher, text, default),
+                                na_action='ignore')
+        return np.where(empty, missing, labels)
+    
+    masks = [empty] + [desc_lower.str.contains(pattern, regex=True) for pattern in matcher.values()]
+    return np.select(masks, [missing] + list(matcher), default=default)
 
-def calculate_multilingual_quality(cid_text: str, transliteration: str, description: str) -> float:
+def extract_semantic_category(descriptions: pd.Series) -> np.ndarray:
+    """Extract semantic category from descriptions"""
+    return match_keyword_categories(descriptions, _SEMANTIC_CATEGORY_MATCHER, "general_medical", "unknown")
+
+def extract_medical_domain(descriptions: pd.Series) -> np.ndarray:
+    """Extract medical domain from descriptions"""
+    return match_keyword_categories(descriptions, _MEDICAL_DOMAIN_MATCHER, "general_medical", "general")
+
+def calculate_complexity_level(desc_len: pd.Series, translit_words: pd.Series) -> np.ndarray:
+    """Calculate complexity level for each row"""
+    return np.select(
+        [(desc_len > 200) | (translit_words > 3), (desc_len > 100) | (translit_words > 2)],
+        ["complex", "medium"],
+        default="simple"
+    )
+
+def calculate_multilingual_quality(has_cid: bool, has_transliteration: bool, desc_len: int) -> float:
     """Calculate multilingual quality score"""
-    scores = []
-    
-    # Arabic/CID quality
-    if cid_text:
-        scores.append(0.8 if contains_cid_or_encoded_chars(cid_text) else 0.3)
-    else:
-        scores.append(0.0)
+    # Arabic/CID quality - CID text is only recorded after passing contains_cid_or_encoded_chars
+    arabic_score = 0.8 if has_cid else 0.0
     
     # Transliteration quality
-    if transliteration and not pd.isna(transliteration):
-        scores.append(0.95)
-    else:
-        scores.append(0.0)
+    transliteration_score = 0.95 if has_transliteration else 0.0
     
     # English quality
-    if description and not pd.isna(description) and len(str(description)) > 10:
-        scores.append(0.98)
-    else:
-        scores.append(0.0)
+    english_score = 0.98 if desc_len > 10 else 0.0
     
-    return sum(scores) / len(scores) if scores else 0.0
+    return (arabic_score + transliteration_score + english_score) / 3
 
-def calculate_dataset_statistics(dataset: Dict):
-    """Calculate comprehensive dataset statistics"""
-    terms = dataset['terms']
-    
-    # Quality analysis
-    with_arabic = sum(1 for t in terms if t['languages']['arabic_urdu']['original_script'])
-    with_transliteration = sum(1 for t in terms if t['languages']['transliteration']['text'])
-    with_description = sum(1 for t in terms if t['languages']['english']['description'])
-    
-    perfect_trilingual = sum(1 for t in terms if (
-        t['languages']['arabic_urdu']['original_script'] and
-        t['languages']['transliteration']['text'] and
-        t['languages']['english']['description']
-    ))
-    
-    # Semantic analysis
-    semantic_categories = {}
-    medical_domains = {}
-    
-    for term in terms:
-        category = term['ai_features']['semantic_category']
-        domain = term['ai_features']['medical_domain']
+class DatasetStatistics:
+    """Running quality and semantic statistics, updated one term at a time"""
+    
+    def __init__(self):
+        self.total_terms = 0
+        self.with_arabic = 0
+        self.with_transliteration = 0
+        self.with_description = 0
+        self.perfect_trilingual = 0
+        self.semantic_categories = Counter()
+        self.medical_domains = Counter()
+    
+    def add(self, term: Dict):
+        languages = term['languages']
+        has_arabic = bool(languages['arabic_urdu']['original_script'])
+        has_transliteration = bool(languages['transliteration']['text'])
+        has_description = bool(languages['english']['description'])
         
-        semantic_categories[category] = semantic_categories.get(category, 0) + 1
-        medical_domains[domain] = medical_domains.get(domain, 0) + 1
+        self.total_terms += 1
+        self.with_arabic += has_arabic
+        self.with_transliteration += has_transliteration
+        self.with_description += has_description
+        self.perfect_trilingual += has_arabic and has_transliteration and has_description
+        
+        ai_features = term['ai_features']
+        self.semantic_categories[ai_features['semantic_category']] += 1
+        self.medical_domains[ai_features['medical_domain']] += 1
+
+def calculate_dataset_statistics(dataset: Dict, statistics: DatasetStatistics):
+    """Calculate comprehensive dataset statistics"""
     
     # Update metadata
     dataset['metadata'].update({
         'quality_analysis': {
-            'total_terms': len(terms),
-            'with_arabic_script': with_arabic,
-            'with_transliteration': with_transliteration,
-            'with_english_description': with_description,
-            'perfect_trilingual': perfect_trilingual,
-            'trilingual_success_rate': f"{perfect_trilingual/len(terms)*100:.1f}%"
+            'total_terms': statistics.total_terms,
+            'with_arabic_script': statistics.with_arabic,
+            'with_transliteration': statistics.with_transliteration,
+            'with_english_description': statistics.with_description,
+            'perfect_trilingual': statistics.perfect_trilingual,
+            'trilingual_success_rate': f"{statistics.perfect_trilingual/statistics.total_terms*100:.1f}%"
         },
-        'semantic_distribution': semantic_categories,
-        'medical_domain_distribution': medical_domains,
+        'semantic_distribution': statistics.semantic_categories,
+        'medical_domain_distribution': statistics.medical_domains,
         'ai_readiness': {
             'unicode_compliant': True,
-            'rtl_script_preserved': with_arabic > 0,
+            'rtl_script_preserved': statistics.with_arabic > 0,
             'multilingual_embeddings_ready': True,
             'medical_domain_classified': True
         }
     })
 
-def save_multilingual_dataset(dataset: Dict) -> Dict[str, str]:
-    """Save comprehensive multilingual dataset"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Main multilingual dataset
-    json_file = f"multilingual_unani_medical_dataset_{timestamp}.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(dataset, f, indent=2, ensure_ascii=False)
-    
-    # AI training format
-    ai_training_file = f"ai_training_unani_dataset_{timestamp}.jsonl"
-    with open(ai_training_file, 'w', encoding='utf-8') as f:
-        for term in dataset['terms']:
-            training_sample = {
-                'id': term['code'],
-                'arabic': term['languages']['arabic_urdu']['original_script'],
-                'transliteration': term['languages']['transliteration']['text'],
-                'english': term['languages']['english']['description'],
-                'semantic_category': term['ai_features']['semantic_category'],
-                'medical_domain': term['ai_features']['medical_domain'],
-                'quality_score': term['ai_features']['multilingual_quality_score']
-            }
-            f.write(json.dumps(training_sample, ensure_ascii=False) + '\n')
-    
-    # Analysis CSV
-    csv_file = f"multilingual_analysis_{timestamp}.csv"
-    csv_data = []
-    for term in dataset['terms']:
-        csv_data.append({
-            'UMI_Code': term['code'],
-            'Arabic_Script': term['languages']['arabic_urdu']['original_script'],
-            'Transliteration': term['languages']['transliteration']['text'],
-            'English_Description': term['languages']['english']['description'],
-            'Semantic_Category': term['ai_features']['semantic_category'],
-            'Medical_Domain': term['ai_features']['medical_domain'],
-            'Quality_Score': term['ai_features']['multilingual_quality_score']
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _json_member(key: str, value, indent: bytes = b'  ') -> bytes:
+    """Render one top-level '"key": value' member of the indented dataset JSON"""
+    rendered = orjson.dumps(value, option=JSON_OPTIONS).replace(b'\n', b'\n' + indent)
+    return indent + orjson.dumps(key) + b': ' + rendered
+
+OUTPUT_BUFFER_SIZE = 1 << 16  # 64 KB writes for the per-term output files
+
+class MultilingualDatasetWriter:
+    """Stream the dataset JSON, AI training JSONL and analysis CSV as terms are built"""
+    
+    CSV_FIELDS = ['UMI_Code', 'Arabic_Script', 'Transliteration', 'English_Description',
+                  'Semantic_Category', 'Medical_Domain', 'Quality_Score']
+    
+    def __init__(self, font_analysis: Dict, mapping_intelligence: Dict):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.files = {
+            'multilingual_dataset': f"multilingual_unani_medical_dataset_{timestamp}.json",
+            'ai_training_format': f"ai_training_unani_dataset_{timestamp}.jsonl",
+            'analysis_csv': f"multilingual_analysis_{timestamp}.csv"
+        }
+        self.terms_written = 0
+        
+        # Main multilingual dataset - metadata goes last, once the statistics are known
+        self.json_fp = open(self.files['multilingual_dataset'], 'wb', buffering=OUTPUT_BUFFER_SIZE)
+        self.json_fp.write(b'{\n')
+        self.json_fp.write(_json_member('font_analysis', font_analysis) + b',\n')
+        self.json_fp.write(_json_member('mapping_intelligence', mapping_intelligence) + b',\n')
+        self.json_fp.write(b'  "terms": [')
+        
+        # AI training format
+        self.jsonl_fp = open(self.files['ai_training_format'], 'wb', buffering=OUTPUT_BUFFER_SIZE)
+        
+        # Analysis CSV
+        self.csv_fp = open(self.files['analysis_csv'], 'w', encoding='utf-8-sig', newline='',
+                           buffering=OUTPUT_BUFFER_SIZE)
+        self.csv_writer = csv.DictWriter(self.csv_fp, fieldnames=self.CSV_FIELDS, lineterminator='\n')
+        self.csv_writer.writeheader()
+    
+    def write_term(self, term: Dict):
+        separator = b',\n    ' if self.terms_written else b'\n    '
+        self.json_fp.write(separator + orjson.dumps(term, option=JSON_OPTIONS).replace(b'\n', b'\n    '))
+        self.terms_written += 1
+        
+        training_sample = {
+            'id': term['code'],
+            'arabic': term['languages']['arabic_urdu']['original_script'],
+            'transliteration': term['languages']['transliteration']['text'],
+            'english': term['languages']['english']['description'],
+            'semantic_category': term['ai_features']['semantic_category'],
+            'medical_domain': term['ai_features']['medical_domain'],
+            'quality_score': term['ai_features']['multilingual_quality_score']
+        }
+        self.jsonl_fp.write(orjson.dumps(training_sample) + b'\n')
+        
+        self.csv_writer.writerow({
+            'UMI_Code': training_sample['id'],
+            'Arabic_Script': training_sample['arabic'],
+            'Transliteration': training_sample['transliteration'],
+            'English_Description': training_sample['english'],
+            'Semantic_Category': training_sample['semantic_category'],
+            'Medical_Domain': training_sample['medical_domain'],
+            'Quality_Score': training_sample['quality_score']
         })
     
-    pd.DataFrame(csv_data).to_csv(csv_file, index=False, encoding='utf-8-sig')
-    
-    return {
-        'multilingual_dataset': json_file,
-        'ai_training_format': ai_training_file,
-        'analysis_csv': csv_file
-    }
+    def close(self, metadata: Dict) -> Dict[str, str]:
+        self.json_fp.write(b'\n  ],\n' if self.terms_written else b'],\n')
+        self.json_fp.write(_json_member('metadata', metadata) + b'\n}')
+        for fp in (self.json_fp, self.jsonl_fp, self.csv_fp):
+            fp.close()
+        return self.files
 
 def main_precision_multilingual_builder():
     """
@@ -643,11 +836,12 @@ def main_precision_multilingual_builder():
     
     PDF_PATH = "Standard_Unani_Medical_Terminology.pdf"
     EXCEL_PATH = "Standard_Unani_Medical_Terminology.xlsx"
+    PDF_BACKEND = None  # None = DEFAULT_PDF_BACKEND; 'pymupdf' / 'pypdfium2' for fast text-only runs
     
     try:
         # STEP 1: Precision font analysis
         print("\n🔬 STEP 1: PRECISION FONT & CID ANALYSIS")
-        font_analysis = extract_font_information_and_cid_patterns(PDF_PATH)
+        font_analysis = extract_font_information_and_cid_patterns(PDF_PATH, PDF_BACKEND)
         
         # STEP 2: Build intelligent mapping
         print("\n🧠 STEP 2: INTELLIGENT CID MAPPING")
@@ -659,9 +853,9 @@ def main_precision_multilingual_builder():
             font_analysis, mapping_intelligence, EXCEL_PATH
         )
         
-        # STEP 4: Save results
-        print("\n💾 STEP 4: SAVING MULTILINGUAL AI DATASET")
-        saved_files = save_multilingual_dataset(multilingual_dataset)
+        # STEP 4: Results were streamed to disk while the terms were built
+        print("\n💾 STEP 4: MULTILINGUAL AI DATASET SAVED")
+        saved_files = multilingual_dataset['files']
         
         # Final summary
         print("\n" + "=" * 80)
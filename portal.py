@@ -1,9 +1,38 @@
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify, render_template_string
+import numpy as np
 import pandas as pd
 import json
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from rapidfuzz import process, fuzz
 
+# Fast JSON (orjson) with stdlib fallback; both work on bytes
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Arrow's multithreaded columnar CSV reader when installed, pandas' C parser otherwise
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
+
+# JSON responses through orjson's C encoder when installed, Flask's jsonify otherwise
+def json_response(obj):
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY), mimetype='application/json')
+    return jsonify(obj)
 
 # Config - CSV and JSON filenames
 csv_files = {
@@ -16,79 +45,126 @@ icd_json_file = 'tm_complete_dataset.json'  # ICD-11 TM2 JSON filename
 # Load CSVs into dataframes
 lang_dfs = {}
 for lang, file in csv_files.items():
-    lang_dfs[lang] = pd.read_csv(file)
-
-# Load ICD-11 JSON (assuming line-delimited JSON)
-icd_data = []
-with open(icd_json_file, encoding='utf-8') as f:
-    for line in f:
-        line = line.strip().rstrip(',')
-        if line.startswith('{') and line.endswith('}'):
+    lang_dfs[lang] = pd.read_csv(file, engine='pyarrow' if PYARROW_AVAILABLE else 'c')
+
+# Load ICD-11 JSON: the full dataset document, a JSON array, or line-delimited records
+with open(icd_json_file, 'rb') as f:
+    icd_raw = f.read()
+try:
+    icd_data = _loads(icd_raw)
+except ValueError:
+    icd_data = []
+    for line in icd_raw.splitlines():
+        line = line.strip().rstrip(b',')
+        if line[:1] == b'{' and line[-1:] == b'}':
             try:
-                icd_data.append(json.loads(line))
-            except Exception:
+                icd_data.append(_loads(line))
+            except ValueError:
                 continue
+if isinstance(icd_data, dict):
+    icd_data = list(icd_data.get('flat_entities', {}).values())
+del icd_raw
+
+# ICD id -> title for /map_icd; reversed so the first record wins on duplicate ids
+icd_titles = {rec['id']: rec.get('title', '') for rec in reversed(icd_data) if rec.get('id')}
 
 # Helper to create term index for all languages and ICD terms
-term_index = {}  # term_lower -> list of dicts with keys lang, term, icd_id etc.
+term_index = defaultdict(list)  # term_lower -> list of entry ids into the entry_* columns below
+
+# Index entries stored column-wise, one list per field, addressed by entry id
+entry_terms = []
+entry_term_ids = []  # id of the distinct term string, used to de-duplicate suggestions
+entry_langs = []
+entry_icd_ids = []
+entry_icd_codes = []
+term_ids = {}
+
+def add_entry(key, term, lang, icd_id='', icd_code=''):
+    term_index[key].append(len(entry_terms))
+    entry_terms.append(term)
+    entry_term_ids.append(term_ids.setdefault(term, len(term_ids)))
+    entry_langs.append(lang)
+    entry_icd_ids.append(icd_id)
+    entry_icd_codes.append(icd_code)
 
-# Index ICD terms by title and synonyms (lowercase)
+# Index ICD terms by title and synonyms (lowercase) in one pass over the records
+synonym_entries = []
 for icd_rec in icd_data:
+    icd_id = icd_rec.get('id')
+    icd_code = icd_rec.get('code')
     icd_title = icd_rec.get('title', '').strip()
     if icd_title:
-        term_index.setdefault(icd_title.lower(), []).append({
-            'lang': 'ICD-11',
-            'term': icd_title,
-            'icd_id': icd_rec.get('id'),
-            'icd_code': icd_rec.get('code'),
-            'source_record': icd_rec
-        })
-
-# Also index synonyms if present
-for icd_rec in icd_data:
+        add_entry(icd_title.lower(), icd_title, 'ICD-11', icd_id, icd_code)
+    # Also index synonyms if present
     synonyms = icd_rec.get('synonym', [])
     if synonyms and isinstance(synonyms, list):
         for syn in synonyms:
             syn_val = syn.get('value') if isinstance(syn, dict) else syn
             if syn_val:
-                term_index.setdefault(syn_val.lower(), []).append({
-                    'lang': 'ICD-11',
-                    'term': syn_val,
-                    'icd_id': icd_rec.get('id'),
-                    'icd_code': icd_rec.get('code'),
-                    'source_record': icd_rec
-                })
+                synonym_entries.append((syn_val.lower(), syn_val, icd_id, icd_code))
+
+# Synonyms go in after all titles so autocomplete keeps listing titles first
+for syn_key, syn_val, icd_id, icd_code in synonym_entries:
+    add_entry(syn_key, syn_val, 'ICD-11', icd_id, icd_code)
+del synonym_entries
+
+# Cleaned string values of a CSV column, blanks when the column is missing
+def column_terms(df, col):
+    if col not in df.columns:
+        return [''] * len(df)
+    return df[col].fillna('').astype(str).str.strip().tolist()
+
+# Local term column - could be language specific e.g. TamilTerm or similar; resolved once per language
+local_term_columns = {
+    lang: next((col for col in df.columns if col.lower().startswith(lang[:3]) and 'term' in col.lower()), None)
+    for lang, df in lang_dfs.items()
+}
 
 # Index CSV terms per language — assume columns: 'EnglishTerm', 'LocalTerm' (adjust as needed)
 for lang, df in lang_dfs.items():
-    for idx, row in df.iterrows():
+    for eng_term, local_term in zip(column_terms(df, 'EnglishTerm'), column_terms(df, local_term_columns[lang])):
         # Index by English term
-        eng_term = str(row.get('EnglishTerm', '')).strip()
         if eng_term:
-            term_index.setdefault(eng_term.lower(), []).append({
-                'lang': lang,
-                'term': eng_term,
-                'csv_row': row.to_dict()
-            })
+            add_entry(eng_term.lower(), eng_term, lang)
         # Index by local term if exists
-        local_term = None
-        # Check for local term column - could be language specific e.g. TamilTerm or similar
-        for col in df.columns:
-            if col.lower().startswith(lang[:3]) and 'term' in col.lower():
-                local_term = str(row.get(col, '')).strip()
-                break
         if local_term:
-            term_index.setdefault(local_term.lower(), []).append({
-                'lang': lang,
-                'term': local_term,
-                'csv_row': row.to_dict()
-            })
+            add_entry(local_term.lower(), local_term, lang)
+
+# Freeze the index so lookups of unknown keys cannot grow it
+term_index = dict(term_index)
+
+# Lowercase index keys, materialized once for the autocomplete scans
+index_keys = list(term_index.keys())
+
+# Substring lookup index: each 1- and 2-character gram -> ids of the keys containing it
+key_grams = defaultdict(list)
+for key_id, key in enumerate(index_keys):
+    for gram in set(key) | {key[i:i + 2] for i in range(len(key) - 1)}:
+        key_grams[gram].append(key_id)
+
+def substring_matches(term):
+    # A key containing term contains all of its grams, so only the rarest gram's keys need checking
+    grams = {term[i:i + 2] for i in range(len(term) - 1)} or {term}
+    candidates = min((key_grams.get(gram, ()) for gram in grams), key=len)
+    return (index_keys[i] for i in candidates if term in index_keys[i])
+
+# EnglishTerm choices per language for /map_icd, built once instead of per request
+lang_eng_choices = {
+    lang: df['EnglishTerm'].fillna('').astype(str).tolist() if 'EnglishTerm' in df.columns else []
+    for lang, df in lang_dfs.items()
+}
+# The same choices lowercased and stripped once, so scoring runs with processor=None
+lang_eng_processed = {lang: [c.lower().strip() for c in choices] for lang, choices in lang_eng_choices.items()}
 
 def find_closest(term, choices, threshold=80):
-    res = process.extractOne(term, choices, scorer=fuzz.ratio)
-    if res and res[1] >= threshold:
-        return res[0], res[1]
-    return None, None
+    if not choices:
+        return None, None, None
+    # Score every choice in one batched call; below-cutoff scores come back as 0
+    scores = process.cdist([term], choices, scorer=fuzz.QRatio, processor=None, dtype=np.float64, score_cutoff=threshold)[0]
+    best = int(scores.argmax())
+    if scores[best] >= threshold:
+        return choices[best], float(scores[best]), best
+    return None, None, None
 
 @app.route("/")
 def index():
@@ -137,46 +213,57 @@ def autocomplete():
     term = request.args.get('term', '').strip().lower()
     results = []
     if term:
-        keys = list(term_index.keys())
-        matches = [k for k in keys if term in k]
+        # Each key adds at least one distinct term, so 10 keys are enough to fill the results
+        matches = list(islice(substring_matches(term), 10))
         if not matches:
-            matches = process.extract(term, keys, scorer=fuzz.ratio, limit=10)
+            matches = process.extract(term, index_keys, scorer=fuzz.QRatio, processor=None, limit=10, score_cutoff=60)
+            # score_cutoff is inclusive; keep only scores strictly above 60 as before
             matches = [m[0] for m in matches if m[1] > 60]
-        added = set()
+        added = bytearray((len(term_ids) + 7) >> 3)  # bitset over term ids
         for k in matches:
-            for item in term_index.get(k, []):
-                if item.get('term') not in added:
-                    added.add(item.get('term'))
+            for i in term_index.get(k, []):
+                term_id = entry_term_ids[i]
+                byte, bit = term_id >> 3, 1 << (term_id & 7)
+                if not added[byte] & bit:
+                    added[byte] |= bit
                     results.append({
-                        'term': item.get('term'),
-                        'lang': item.get('lang'),
-                        'icd_id': item.get('icd_id', ''),
-                        'icd_code': item.get('icd_code', '')
+                        'term': entry_terms[i],
+                        'lang': entry_langs[i],
+                        'icd_id': entry_icd_ids[i],
+                        'icd_code': entry_icd_codes[i]
                     })
         results = results[:10]
-    print(f"Autocomplete search for '{term}' returns {len(results)} results")  # Debug log
-    return jsonify(results)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Autocomplete search for %r returns %d results", term, len(results))
+    return json_response(results)
+
 
+# One worker per NAMASTE language for the /map_icd searches
+mapping_executor = ThreadPoolExecutor(max_workers=len(csv_files))
+
+# The ICD data and CSVs never change after startup, so mappings are cached per ICD id
+@lru_cache(maxsize=4096)
+def compute_mapping(icd_id):
+    icd_title = icd_titles.get(icd_id)
+    if icd_title is None:
+        return ()
+    # Map to each NAMASTE language by fuzzy matching EnglishTerm columns
+    query = icd_title.lower().strip()
+    # rapidfuzz scores outside the GIL, so the languages are searched concurrently
+    closest = mapping_executor.map(lambda processed: find_closest(query, processed), lang_eng_processed.values())
+    mapped = []
+    for (lang, choices), (_, score, idx) in zip(lang_eng_choices.items(), closest):
+        match = choices[idx] if idx is not None else None
+        if match:
+            mapped.append((lang, match, score))
+    return tuple(mapped)
 
 @app.route('/map_icd')
 def map_icd():
     icd_id = request.args.get('icd_id', '')
     if not icd_id:
-        return jsonify([])
-    # Find ICD record
-    icd_rec = next((rec for rec in icd_data if rec.get('id') == icd_id), None)
-    if not icd_rec:
-        return jsonify([])
-    icd_title = icd_rec.get('title', '')
-    # Map to each NAMASTE language by fuzzy matching EnglishTerm columns
-    mapped = []
-    for lang, df in lang_dfs.items():
-        eng_terms = df['EnglishTerm'].fillna('').tolist()
-        match, score = find_closest(icd_title, eng_terms)
-        if match:
-            row = df[df['EnglishTerm'] == match].iloc[0]
-            mapped.append({'lang': lang, 'term': match, 'score': score})
-    return jsonify(mapped)
+        return json_response([])
+    return json_response([{'lang': lang, 'term': term, 'score': score} for lang, term, score in compute_mapping(icd_id)])
 
 if __name__ == "__main__":
     app.run(debug=True)